@@ -0,0 +1,196 @@
+import os
+
+from .columns import normalize_values
+from .normalizer import enable_persistent_cache, worker_pool
+from .telemetry import get_error_telemetry
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError as e:
+        raise ImportError("bangla_normalizer.arrow_io needs pyarrow: pip install pyarrow") from e
+    return pyarrow, pyarrow.compute
+
+
+def normalize_array(array, pipeline=None):
+    """
+    Normalize a pyarrow string array (string, large_string or a dictionary
+    of them) and return an array of the same type. Nulls stay null.
+
+    Only the distinct values of the array are converted to Python strings
+    and normalized (see `columns.normalize_values`); the result is
+    assembled from them by index inside Arrow.
+    """
+    pa, pc = _import_pyarrow()
+    if pa.types.is_dictionary(array.type):
+        dictionary = array.dictionary
+        if not (pa.types.is_string(dictionary.type) or pa.types.is_large_string(dictionary.type)):
+            raise TypeError(f"expected a string column, not {array.type}")
+        normalized = pa.array(normalize_values(dictionary.to_pylist(), pipeline), type=dictionary.type)
+        return pa.DictionaryArray.from_arrays(array.indices, normalized)
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        raise TypeError(f"expected a string column, not {array.type}")
+    encoded = array.dictionary_encode()
+    normalized = pa.array(normalize_values(encoded.dictionary.to_pylist(), pipeline), type=array.type)
+    return pc.take(normalized, encoded.indices)
+
+
+def normalize_record_batch(batch, column, output_column=None, pipeline=None):
+    """
+    Return `batch` with the string column `column` normalized, either in
+    place of the original or, if `output_column` is given, as a new (or
+    replaced) column of that name.
+    """
+    pa, _ = _import_pyarrow()
+    index = batch.schema.get_field_index(column)
+    if index < 0:
+        raise KeyError(f"no column named {column!r}")
+    normalized = normalize_array(batch.column(index), pipeline)
+    name = output_column or column
+    field = pa.field(name, normalized.type)
+    arrays = list(batch.columns)
+    schema = batch.schema
+    target = schema.get_field_index(name)
+    if target < 0:
+        arrays.append(normalized)
+        schema = schema.append(field)
+    else:
+        arrays[target] = normalized
+        schema = schema.set(target, field)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def normalize_table(table, column, output_column=None, pipeline=None, batch_size=65536):
+    """
+    Normalize the string column `column` of a pyarrow Table, `batch_size`
+    rows at a time; see `normalize_record_batch`.
+    """
+    pa, _ = _import_pyarrow()
+    batches = [
+        normalize_record_batch(batch, column, output_column, pipeline)
+        for batch in table.to_batches(max_chunksize=batch_size)
+    ]
+    if not batches:
+        empty = pa.RecordBatch.from_pylist([], schema=table.schema)
+        batches = [normalize_record_batch(empty, column, output_column, pipeline)]
+    return pa.Table.from_batches(batches)
+
+
+def normalize_parquet(input_path, output_path, column, output_column=None, pipeline=None,
+                      batch_size=65536, row_groups=None, compression='snappy'):
+    """
+    Normalize the string column `column` of the Parquet file `input_path`
+    into a new Parquet file `output_path`, reading and writing one record
+    batch of at most `batch_size` rows at a time, so memory is bounded by
+    the batch size rather than the file. `row_groups` restricts the work to
+    those row groups of the input. The output file is written atomically.
+    Returns the number of rows written.
+    """
+    pa, _ = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    source = pq.ParquetFile(input_path)
+    temporary_path = f"{output_path}.tmp"
+    rows = 0
+    writer = None
+    try:
+        for batch in source.iter_batches(batch_size=batch_size, row_groups=row_groups):
+            batch = normalize_record_batch(batch, column, output_column, pipeline)
+            if writer is None:
+                writer = pq.ParquetWriter(temporary_path, batch.schema, compression=compression)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+        if writer is None:
+            # No rows selected: still write a file with the output schema.
+            empty = pa.RecordBatch.from_pylist([], schema=source.schema_arrow)
+            schema = normalize_record_batch(empty, column, output_column, pipeline).schema
+            writer = pq.ParquetWriter(temporary_path, schema, compression=compression)
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(temporary_path, output_path)
+    return rows
+
+
+def _normalize_row_group(task):
+    input_path, output_path, column, output_column, pipeline, batch_size, row_group, compression = task
+    rows = normalize_parquet(input_path, output_path, column, output_column, pipeline,
+                             batch_size, [row_group], compression)
+    return rows, get_error_telemetry().drain()
+
+
+def normalize_parquet_row_groups(input_path, output_dir, column, output_column=None, pipeline=None,
+                                 batch_size=65536, workers=1, compression='snappy'):
+    """
+    Normalize each row group of the Parquet file `input_path` into its own
+    file `part-NNNNN.parquet` in `output_dir`, spreading the row groups over
+    `workers` processes. The files together form a Parquet dataset in the
+    input's row order. Parts that already exist are kept, so an interrupted
+    run can simply be started again. Returns the paths of all parts.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    os.makedirs(output_dir, exist_ok=True)
+    num_row_groups = pq.ParquetFile(input_path).metadata.num_row_groups
+    paths = [os.path.join(output_dir, f"part-{group:05d}.parquet") for group in range(num_row_groups)]
+    tasks = [
+        (input_path, path, column, output_column, pipeline, batch_size, group, compression)
+        for group, path in enumerate(paths) if not os.path.exists(path)
+    ]
+    telemetry = get_error_telemetry()
+
+    def finish(errors):
+        if errors is not None:
+            telemetry.merge(errors)
+
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        for task in tasks:
+            finish(_normalize_row_group(task)[1])
+    else:
+        with worker_pool(workers) as pool:
+            for _, errors in pool.imap_unordered(_normalize_row_group, tasks):
+                finish(errors)
+    return paths
+
+
+def main(argv=None):
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Normalize a string column of a Parquet file batch by batch."
+    )
+    parser.add_argument('input', help="input Parquet file")
+    parser.add_argument('output', help="output Parquet file, or directory with --by-row-group")
+    parser.add_argument('--column', required=True, help="string column to normalize")
+    parser.add_argument('--output-column', help="column to write the result to (default: --column)")
+    parser.add_argument('--batch-size', type=int, default=65536, help="rows per record batch (default: 65536)")
+    parser.add_argument('--by-row-group', action='store_true',
+                        help="write one part file per input row group, resuming an interrupted run")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="worker processes for --by-row-group; 0 means one per CPU (default: 1)")
+    parser.add_argument('--cache', metavar='PATH', help="persistent cache file to read and fill")
+    args = parser.parse_args(argv)
+
+    if args.cache:
+        enable_persistent_cache(args.cache)
+    try:
+        if args.by_row_group:
+            paths = normalize_parquet_row_groups(args.input, args.output, args.column, args.output_column,
+                                                 batch_size=max(1, args.batch_size),
+                                                 workers=args.workers or os.cpu_count() or 1)
+            print(f"{len(paths)} row groups written to {args.output}")
+        else:
+            rows = normalize_parquet(args.input, args.output, args.column, args.output_column,
+                                     batch_size=max(1, args.batch_size))
+            print(f"{rows} rows written to {args.output}")
+    except (ImportError, KeyError, TypeError) as e:
+        sys.exit(str(e))
+
+
+if __name__ == '__main__':
+    main()
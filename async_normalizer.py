@@ -0,0 +1,161 @@
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .normalizer import normalize_text, worker_setup, _normalize_text_in_worker
+from .telemetry import get_error_telemetry
+
+
+class AsyncNormalizer:
+    """
+    Runs `normalize_text` from asyncio code without blocking the event loop.
+
+    The CPU work goes to `executor`, or to a thread pool (`kind='thread'`,
+    the default) or process pool (`kind='process'`) of `workers` workers
+    created on first use. At most `max_concurrency` calls are submitted at
+    once (the number of workers by default); further calls wait for a slot,
+    which gives backpressure to callers. Every call takes an optional
+    `timeout` in seconds, covering both the wait for a slot and the
+    normalization itself, and raises `asyncio.TimeoutError` when it runs
+    out. A cancelled or timed-out call gives up its slot at once; work that
+    already started in a thread runs to completion in the background.
+    Failures recorded in process pool workers are added to this process's
+    error telemetry.
+    """
+
+    def __init__(self, executor=None, kind='thread', workers=None, max_concurrency=None):
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"kind must be 'thread' or 'process', not {kind!r}")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.kind == 'process':
+                initializer, initargs = worker_setup()
+                self._executor = ProcessPoolExecutor(self.workers, initializer=initializer, initargs=initargs)
+            else:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='bangla-normalizer')
+        return self._executor
+
+    def _get_semaphore(self):
+        # A semaphore belongs to one event loop; start a new one per loop.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
+
+    async def _run(self, text):
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            if not isinstance(executor, ProcessPoolExecutor):
+                return await loop.run_in_executor(executor, normalize_text, text)
+            normalized, errors = await loop.run_in_executor(executor, _normalize_text_in_worker, text)
+            if errors is not None:
+                get_error_telemetry().merge(errors)
+            return normalized
+
+    async def normalize(self, text, timeout=None):
+        """
+        Normalize `text`, waiting at most `timeout` seconds.
+        """
+        return await asyncio.wait_for(self._run(text), timeout)
+
+    async def normalize_batch(self, texts, timeout=None, return_exceptions=False):
+        """
+        Normalize every string in `texts` concurrently and return the results
+        in input order. `timeout` applies to each text separately. With
+        `return_exceptions=True`, a failed or timed-out text yields its
+        exception instead of failing the whole batch.
+        """
+        return await asyncio.gather(
+            *(self.normalize(text, timeout) for text in texts),
+            return_exceptions=return_exceptions,
+        )
+
+    async def normalize_stream(self, texts, timeout=None):
+        """
+        Normalize an iterable or async iterable of strings, yielding results
+        in input order. At most `max_concurrency` texts are in flight, and
+        no more input is read until a slot frees up. Leaving the loop early
+        cancels the texts still in flight.
+        """
+        pending = deque()
+        try:
+            if hasattr(texts, '__aiter__'):
+                async for text in texts:
+                    pending.append(asyncio.ensure_future(self.normalize(text, timeout)))
+                    if len(pending) >= self.max_concurrency:
+                        yield await pending.popleft()
+            else:
+                for text in texts:
+                    pending.append(asyncio.ensure_future(self.normalize(text, timeout)))
+                    if len(pending) >= self.max_concurrency:
+                        yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self, wait=True):
+        """
+        Shut down the executor if this normalizer created it.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    async def aclose(self):
+        """
+        Like `close`, but waits for the executor to finish in a helper
+        thread so the event loop keeps running meanwhile.
+        """
+        if self._owns_executor and self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+_default_normalizer = None
+
+
+def _get_default_normalizer():
+    global _default_normalizer
+    if _default_normalizer is None:
+        _default_normalizer = AsyncNormalizer()
+    return _default_normalizer
+
+
+async def normalize_text_async(text, timeout=None):
+    """
+    Awaitable `normalize_text` running in a shared thread pool; see
+    `AsyncNormalizer` for `timeout`, backpressure and cancellation.
+    """
+    return await _get_default_normalizer().normalize(text, timeout)
+
+
+async def normalize_batch_async(texts, timeout=None, return_exceptions=False):
+    """
+    `AsyncNormalizer.normalize_batch` on the shared thread pool.
+    """
+    return await _get_default_normalizer().normalize_batch(texts, timeout, return_exceptions)
+
+
+async def iter_normalize_async(texts, timeout=None):
+    """
+    `AsyncNormalizer.normalize_stream` on the shared thread pool.
+    """
+    async for normalized in _get_default_normalizer().normalize_stream(texts, timeout):
+        yield normalized
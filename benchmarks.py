@@ -0,0 +1,315 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from .normalizer import (
+    normalize_dates, normalize_distance, normalize_phonenumbers,
+    normalize_numbers, normalize_time, normalize_taka, normalize_percentage,
+    normalize_temperatures, normalize_ratio, normalize_ordinal, normalize_year,
+    normalize_text, bangla_to_ipa_converter, normalize_spans,
+)
+from .extractor import warm_up
+
+
+# The span normalizers in `SPAN_STAGES` order, run one after another the way
+# `normalize_text` did before `normalize_spans`: each finds its matches and
+# replaces them across the whole text with `str.replace`.
+SEQUENTIAL_NORMALIZERS = (
+    normalize_distance, normalize_temperatures, normalize_time, normalize_dates,
+    normalize_phonenumbers, normalize_taka, normalize_percentage, normalize_ratio,
+    normalize_ordinal, normalize_year, normalize_numbers,
+)
+
+
+def sequential_normalizers(text):
+    """
+    Apply every function in `SEQUENTIAL_NORMALIZERS` to `text` in turn, as a
+    baseline for `normalize_spans`.
+    """
+    for normalizer in SEQUENTIAL_NORMALIZERS:
+        text = normalizer(text)
+    return text
+
+
+# Functions measured, by the name they are reported under.
+BENCHMARK_TARGETS = {
+    'normalize_dates': normalize_dates,
+    'normalize_distance': normalize_distance,
+    'normalize_phonenumbers': normalize_phonenumbers,
+    'normalize_numbers': normalize_numbers,
+    'normalize_time': normalize_time,
+    'normalize_taka': normalize_taka,
+    'normalize_percentage': normalize_percentage,
+    'normalize_temperatures': normalize_temperatures,
+    'normalize_ratio': normalize_ratio,
+    'normalize_ordinal': normalize_ordinal,
+    'normalize_year': normalize_year,
+    'normalize_text': normalize_text,
+    'bangla_to_ipa_converter': bangla_to_ipa_converter,
+    'normalize_spans': normalize_spans,
+    'sequential_normalizers': sequential_normalizers,
+}
+
+# Share of tokens that are non-standard words (numbers, dates, ...) in each corpus.
+NSW_DENSITIES = (0.0, 0.1, 0.3, 0.6)
+
+# Corpus length name -> (texts per corpus, sentences per text).
+CORPUS_LENGTHS = {
+    'short': (200, 1),
+    'long': (20, 25),
+}
+
+# Import-time budget, in milliseconds, for importing each module into a fresh
+# interpreter (median of several runs). The normalizer must not pay for the
+# IPA tables, the cache backends or multiprocessing until they are used.
+IMPORT_TIME_BUDGETS_MS = {
+    'normalizer': 60,
+    'methods': 45,
+    'extractor': 25,
+}
+
+_english_to_bangla_digits = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
+
+_plain_words = (
+    "আজ ঢাকায় বৃষ্টি হয়েছে এবং সরকার নতুন বাজেট ঘোষণা করেছে যা দেশের "
+    "অর্থনীতির জন্য গুরুত্বপূর্ণ বলে মনে করা হচ্ছে তিনি বাজারে গিয়ে চাল ডাল "
+    "কিনেছেন ট্রেন স্টেশন থেকে ছাড়বে facebook youtube"
+).split()
+
+_bangla_months = ['জানুয়ারি', 'মার্চ', 'মে', 'আগস্ট', 'ডিসেম্বর']
+_english_months = ['January', 'May', 'Dec']
+
+
+def _digits(value, rng):
+    value = str(value)
+    return value.translate(_english_to_bangla_digits) if rng.random() < 0.7 else value
+
+
+def _random_nsw(rng):
+    """
+    Return one random non-standard word, drawn evenly from the kinds of
+    span `normalize_text` rewrites.
+    """
+    kind = rng.randrange(12)
+    if kind == 0:
+        if rng.random() < 0.5:
+            return f"{_digits(rng.randint(1, 28), rng)} {rng.choice(_bangla_months)}, {_digits(rng.randint(1950, 2030), rng)}"
+        day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2030)
+        return _digits(f"{day:02d}-{month:02d}-{year}", rng)
+    if kind == 1:
+        return _digits(rng.randint(1, 500), rng) + rng.choice(['কিমি', 'km', 'cm', 'ফুট', '"'])
+    if kind == 2:
+        return rng.choice(['', '+88']) + '01' + str(rng.randint(3, 9)) + ''.join(str(rng.randint(0, 9)) for _ in range(8))
+    if kind == 3:
+        return _digits(f"{rng.randint(0, 23)}:{rng.randint(0, 59):02d}", rng) + rng.choice(['', ' AM', ' PM', ' টায়', ' মিনিটে'])
+    if kind == 4:
+        return rng.choice(['৳', '']) + _digits(rng.randint(1, 99999), rng) + rng.choice([' টাকা', ' টাকার'])
+    if kind == 5:
+        return _digits(rng.randint(1, 100), rng) + rng.choice(['%', ' শতাংশ'])
+    if kind == 6:
+        return rng.choice(['-', '']) + _digits(rng.randint(0, 45), rng) + rng.choice(['°C', ' ডিগ্রি সেলসিয়াস', '°F'])
+    if kind == 7:
+        return _digits(rng.randint(1, 9), rng) + rng.choice([':', ' থেকে ']) + _digits(rng.randint(1, 20), rng)
+    if kind == 8:
+        return rng.choice(['১ম', '২য়', '৩য়', '৪র্থ', '১লা', '২২শে', '3rd', '21st'])
+    if kind == 9:
+        return _digits(rng.randint(1950, 2030), rng) + rng.choice([' সালে', ' সালের'])
+    if kind == 10:
+        return _digits(f"{rng.randint(0, 999)}.{rng.randint(0, 99)}", rng)
+    return _digits(f"{rng.randint(1000, 9999999):,}", rng)
+
+
+def _random_sentence(rng, density):
+    words = [
+        _random_nsw(rng) if rng.random() < density else rng.choice(_plain_words)
+        for _ in range(rng.randint(6, 14))
+    ]
+    return ' '.join(words) + rng.choice(['।', '।', '?', '!'])
+
+
+def build_corpora(seed=0):
+    """
+    Build the fixed benchmark corpora: one list of texts per combination of
+    `CORPUS_LENGTHS` and `NSW_DENSITIES`, named like 'short-d0.3'.  The same
+    seed always yields the same texts, so runs on different commits are
+    comparable.
+    """
+    corpora = {}
+    for length_name, (n_texts, n_sentences) in CORPUS_LENGTHS.items():
+        for density in NSW_DENSITIES:
+            rng = random.Random(f"{seed}-{length_name}-{density}")
+            corpora[f"{length_name}-d{density}"] = [
+                ' '.join(_random_sentence(rng, density) for _ in range(n_sentences))
+                for _ in range(n_texts)
+            ]
+    return corpora
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure(func, texts, repeat=3):
+    """
+    Call `func` on every text in `texts`, `repeat` times over, and return
+    throughput (calls and characters per second) and per-call latency
+    percentiles in milliseconds.
+    """
+    latencies = []
+    perf_counter = time.perf_counter
+    for _ in range(repeat):
+        for text in texts:
+            start = perf_counter()
+            func(text)
+            latencies.append(perf_counter() - start)
+
+    total = sum(latencies)
+    latencies.sort()
+    n_chars = repeat * sum(len(text) for text in texts)
+    return {
+        'calls': len(latencies),
+        'chars': n_chars,
+        'total_seconds': total,
+        'calls_per_second': len(latencies) / total if total else None,
+        'chars_per_second': n_chars / total if total else None,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000,
+    }
+
+
+def measure_import_time(module, runs=5):
+    """
+    Import `module` (a name inside this package) into `runs` fresh
+    interpreters and return the median import time in milliseconds.
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {__package__}.{module}; "
+        "print(time.perf_counter() - start)"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    timings = [
+        float(subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                             capture_output=True, text=True).stdout)
+        for _ in range(runs)
+    ]
+    return statistics.median(timings) * 1000
+
+
+def check_import_budgets(budgets=None, runs=5):
+    """
+    Measure the import time of every module in `budgets` (default:
+    `IMPORT_TIME_BUDGETS_MS`) and return, per module, the median time, the
+    budget and whether it was met.
+    """
+    if budgets is None:
+        budgets = IMPORT_TIME_BUDGETS_MS
+    results = {}
+    for module, budget in budgets.items():
+        median_ms = measure_import_time(module, runs)
+        results[module] = {'median_ms': median_ms, 'budget_ms': budget, 'within_budget': median_ms <= budget}
+    return results
+
+
+def run_benchmarks(targets=None, corpora=None, repeat=3, seed=0, label=None, import_runs=5):
+    """
+    Measure every function in `targets` (default: all of `BENCHMARK_TARGETS`)
+    on every corpus, returning a JSON-serialisable dict of results keyed by
+    target name, then corpus name, plus the import times checked against
+    `IMPORT_TIME_BUDGETS_MS` (skipped when `import_runs` is 0).
+    """
+    imports = check_import_budgets(runs=import_runs) if import_runs else {}
+    if targets is None:
+        targets = BENCHMARK_TARGETS
+    if corpora is None:
+        corpora = build_corpora(seed)
+
+    warm_up()
+    results = {}
+    for name, func in targets.items():
+        func(corpora[next(iter(corpora))][0])
+        results[name] = {
+            corpus_name: measure(func, texts, repeat)
+            for corpus_name, texts in corpora.items()
+        }
+
+    return {
+        'meta': {
+            'label': label,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'repeat': repeat,
+            'corpora': {
+                corpus_name: {'texts': len(texts), 'chars': sum(len(text) for text in texts)}
+                for corpus_name, texts in corpora.items()
+            },
+        },
+        'imports': imports,
+        'results': results,
+        'span_engine_speedup': span_engine_speedup(results),
+    }
+
+
+def span_engine_speedup(results):
+    """
+    How many times faster `normalize_spans` is than `sequential_normalizers`
+    on each corpus, from `run_benchmarks` results. Empty unless both were
+    measured.
+    """
+    if 'normalize_spans' not in results or 'sequential_normalizers' not in results:
+        return {}
+    return {
+        corpus_name: baseline['total_seconds'] / results['normalize_spans'][corpus_name]['total_seconds']
+        for corpus_name, baseline in results['sequential_normalizers'].items()
+        if results['normalize_spans'][corpus_name]['total_seconds']
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the bangla_normalizer stages and write the results as JSON."
+    )
+    parser.add_argument('-o', '--output', help="file to write the JSON results to (default: stdout)")
+    parser.add_argument('-r', '--repeat', type=int, default=3, help="passes over each corpus (default: 3)")
+    parser.add_argument('-s', '--seed', type=int, default=0, help="corpus seed (default: 0)")
+    parser.add_argument('-l', '--label', help="free-form label stored with the results, e.g. a commit id")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARK_TARGETS), metavar='NAME',
+                        help="measure only these functions")
+    parser.add_argument('--import-only', action='store_true', help="only measure import times")
+    parser.add_argument('--check-import-budget', action='store_true',
+                        help="exit with status 1 if an import exceeds its budget")
+    args = parser.parse_args(argv)
+
+    targets = BENCHMARK_TARGETS
+    if args.import_only:
+        targets = {}
+    elif args.only:
+        targets = {name: BENCHMARK_TARGETS[name] for name in args.only}
+
+    report = run_benchmarks(targets, repeat=args.repeat, seed=args.seed, label=args.label)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+
+    over_budget = [module for module, result in report['imports'].items() if not result['within_budget']]
+    if args.check_import_budget and over_budget:
+        sys.exit(f"Import time over budget: {', '.join(over_budget)}")
+
+
+if __name__ == '__main__':
+    main()
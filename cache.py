@@ -0,0 +1,456 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+
+class SentenceCache:
+    """
+    Bounded, thread-safe LRU map from a key to a normalized sentence.
+
+    Least recently used entries are evicted as soon as the cache holds more
+    than `max_entries` entries or more than `max_bytes` bytes, where an
+    entry's size is `sys.getsizeof` of its sentence plus its value.
+    """
+
+    def __init__(self, max_entries=4096, max_bytes=64 << 20):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return the value cached under `key`, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Cache `value` under `key`, where `key[-1]` is the sentence it was
+        computed from, evicting older entries to stay within bounds.
+        Values larger than `max_bytes` on their own are not cached.
+        """
+        size = sys.getsizeof(key[-1]) + sys.getsizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Drop every entry. The hit/miss/eviction counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """
+        Return the counters and current size of the cache as a dict.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+class WordMemo:
+    """
+    Thread-safe memo in front of `compute`, a function from a word to its
+    converted form (IPA, for the memo `normalizer` keeps).
+
+    Words seen while converting are kept in an LRU map of at most
+    `max_entries` words. Words loaded with `preload` go to a separate
+    lexicon that is never evicted. Words longer than `max_word_length`
+    characters are computed on every call and never stored.
+    """
+
+    def __init__(self, compute, max_entries=1 << 16, max_word_length=64):
+        if max_entries < 1 or max_word_length < 1:
+            raise ValueError("max_entries and max_word_length must be positive")
+        self.compute = compute
+        self.max_entries = max_entries
+        self.max_word_length = max_word_length
+        self.hits = 0
+        self.lexicon_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lexicon = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries) + len(self._lexicon)
+
+    def convert(self, words):
+        """
+        Return the list of converted `words`, looking each one up before
+        computing it. Words are looked up and stored under the lock, but
+        computed outside it, so threads never wait on each other's misses.
+        """
+        lexicon = self._lexicon
+        entries = self._entries
+        results = []
+        missing = {}
+        hits = lexicon_hits = misses = 0
+        with self._lock:
+            for position, word in enumerate(words):
+                value = lexicon.get(word)
+                if value is not None:
+                    lexicon_hits += 1
+                else:
+                    value = entries.get(word)
+                    if value is not None:
+                        entries.move_to_end(word)
+                        hits += 1
+                    else:
+                        missing.setdefault(word, []).append(position)
+                results.append(value)
+            # A word missing several times is computed once; its repeats
+            # count as hits when it is short enough to be stored.
+            for word, positions in missing.items():
+                if len(word) <= self.max_word_length:
+                    misses += 1
+                    hits += len(positions) - 1
+                else:
+                    misses += len(positions)
+            self.hits += hits
+            self.lexicon_hits += lexicon_hits
+            self.misses += misses
+        if not missing:
+            return results
+
+        compute = self.compute
+        computed = {}
+        for word, positions in missing.items():
+            value = computed[word] = compute(word)
+            for position in positions:
+                results[position] = value
+
+        max_word_length = self.max_word_length
+        with self._lock:
+            for word, value in computed.items():
+                if len(word) <= max_word_length and word not in entries:
+                    entries[word] = value
+                    if len(entries) > self.max_entries:
+                        entries.popitem(last=False)
+                        self.evictions += 1
+        return results
+
+    def preload(self, words):
+        """
+        Compute and pin every word of the iterable `words`. Returns the
+        number of words added.
+        """
+        words = [word for word in dict.fromkeys(words) if word]
+        with self._lock:
+            pending = {word: self._entries.get(word) for word in words if word not in self._lexicon}
+        computed = {word: value or self.compute(word) for word, value in pending.items()}
+        added = 0
+        with self._lock:
+            for word, value in computed.items():
+                if word not in self._lexicon:
+                    self._entries.pop(word, None)
+                    self._lexicon[word] = value
+                    added += 1
+        return added
+
+    def preload_file(self, path):
+        """
+        Preload the words of a UTF-8 lexicon file: the first whitespace-
+        separated field of each non-empty line, so plain word lists, word
+        frequency lists and TSV lexicons all work. Returns the number of
+        words added.
+        """
+        with open(path, encoding='utf-8') as f:
+            return self.preload(fields[0] for fields in (line.split(None, 1) for line in f) if fields)
+
+    def clear(self):
+        """
+        Drop every entry, preloaded ones included. The counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._lexicon.clear()
+
+    def stats(self):
+        """
+        Return the counters and current size of the memo as a dict.
+        """
+        with self._lock:
+            lookups = self.hits + self.lexicon_hits + self.misses
+            return {
+                'hits': self.hits,
+                'lexicon_hits': self.lexicon_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits + self.lexicon_hits) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'lexicon_entries': len(self._lexicon),
+                'max_entries': self.max_entries,
+            }
+
+
+def library_version():
+    """
+    Return an identifier of this copy of the library: a hash of the modules
+    and conversion tables that produce its output (see
+    `snapshot.code_fingerprint`), so that it changes whenever the output
+    may, also in a source checkout.
+    """
+    from .snapshot import code_fingerprint
+
+    return code_fingerprint()
+
+
+def pipeline_fingerprint(pipeline):
+    """
+    Describe the functions of `pipeline` as a string that is stable across
+    processes (module and qualified name of each function), for use in
+    persistent cache keys.
+    """
+    parts = []
+    for func in pipeline:
+        name = getattr(func, '__qualname__', None)
+        if name is None:
+            parts.append(repr(func))
+        else:
+            parts.append(f"{getattr(func, '__module__', '')}.{name}")
+    return '|'.join(parts)
+
+
+class PersistentCache:
+    """
+    Durable map from a sentence to its normalized form, stored in an SQLite
+    file so that re-runs over a mostly unchanged corpus become lookups.
+
+    Entries are keyed by a SHA-256 hash of the library version (see
+    `library_version`), a pipeline fingerprint and the sentence. The file
+    keeps a running total of the UTF-8 size of every stored sentence and
+    value; as soon as a put takes it beyond `max_bytes`, the oldest entries
+    are evicted down to `eviction_target` of it, and `compact()` also
+    reclaims the freed file space. The file may be shared by several
+    processes, and a cache object carried into a forked child reopens its
+    connection there.
+    """
+
+    # Layout of the cache file, stored as its `user_version`; files of an
+    # older layout are emptied when opened.
+    _file_format = 1
+    eviction_target = 0.9
+
+    def __init__(self, path, max_bytes=1 << 30, version=None):
+        import hashlib
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = library_version() if version is None else version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._sha256 = hashlib.sha256
+        self._connect()
+
+    def _connect(self):
+        import sqlite3
+
+        self._pid = os.getpid()
+        self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        db = self._connection
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("CREATE TABLE IF NOT EXISTS entries (key BLOB PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL)")
+            db.execute("CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)")
+            db.execute("CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+                       "BEGIN UPDATE totals SET bytes = bytes + new.size; END")
+            db.execute("CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+                       "BEGIN UPDATE totals SET bytes = bytes - old.size; END")
+            if db.execute("PRAGMA user_version").fetchone()[0] != self._file_format:
+                # Older files counted characters, not bytes.
+                db.execute("DELETE FROM entries")
+                db.execute(f"PRAGMA user_version = {self._file_format}")
+            db.execute("INSERT OR IGNORE INTO totals VALUES (0, (SELECT COALESCE(SUM(size), 0) FROM entries))")
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+    def _db(self):
+        if self._pid != os.getpid():
+            self._connect()
+        return self._connection
+
+    def settings(self):
+        """
+        Return the arguments that reopen this cache, e.g. in a worker process.
+        """
+        return self.path, self.max_bytes, self.version
+
+    def key(self, sentence, config):
+        """
+        Hash of the library version, pipeline `config` and `sentence`.
+        """
+        return self._sha256(f"{self.version}\0{config}\0{sentence}".encode('utf-8')).digest()
+
+    def get(self, sentence, config):
+        """
+        Return the cached normalized form of `sentence`, or None on a miss.
+        """
+        with self._lock:
+            row = self._db().execute("SELECT value FROM entries WHERE key = ?", (self.key(sentence, config),)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, sentence, config, value):
+        """
+        Store `value` as the normalized form of `sentence`.
+        """
+        size = len(sentence.encode('utf-8')) + len(value.encode('utf-8'))
+        with self._lock:
+            db = self._db()
+            cursor = db.execute(
+                "INSERT OR IGNORE INTO entries (key, value, size) VALUES (?, ?, ?)",
+                (self.key(sentence, config), value, size),
+            )
+            if cursor.rowcount and self._stored_bytes(db) > self.max_bytes:
+                self._evict(int(self.max_bytes * self.eviction_target))
+
+    @staticmethod
+    def _stored_bytes(db):
+        return db.execute("SELECT bytes FROM totals").fetchone()[0]
+
+    def _evict(self, target=None):
+        deleted = self._db().execute(
+            "DELETE FROM entries WHERE rowid IN ("
+            "SELECT rowid FROM (SELECT rowid, SUM(size) OVER (ORDER BY rowid DESC) AS kept FROM entries) "
+            "WHERE kept > ?)",
+            (self.max_bytes if target is None else target,),
+        ).rowcount
+        self.evictions += deleted
+        return deleted
+
+    def evict(self):
+        """
+        Delete the oldest entries until the stored text (in UTF-8 bytes)
+        fits in `max_bytes`.
+        Returns the number of entries deleted.
+        """
+        with self._lock:
+            return self._evict()
+
+    def compact(self):
+        """
+        Evict down to `max_bytes`, then rewrite the file to release the
+        space of deleted entries. Returns the number of entries deleted.
+        """
+        with self._lock:
+            deleted = self._evict()
+            db = self._db()
+            db.execute("VACUUM")
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return deleted
+
+    def clear(self):
+        """
+        Delete every entry.
+        """
+        with self._lock:
+            self._db().execute("DELETE FROM entries")
+
+    def stats(self):
+        """
+        Return this process's counters and the current size of the cache.
+        """
+        with self._lock:
+            db = self._db()
+            entries = db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': entries,
+                'bytes': self._stored_bytes(db),
+                'max_bytes': self.max_bytes,
+                'file_bytes': os.path.getsize(self.path),
+                'version': self.version,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Inspect or compact a persistent normalization cache.")
+    parser.add_argument('command', choices=['stats', 'compact', 'clear'])
+    parser.add_argument('path', help="SQLite cache file")
+    parser.add_argument('--max-bytes', type=int, default=1 << 30,
+                        help="size to evict down to when compacting (default: 1 GiB)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        parser.error(f"no cache file at {args.path}")
+    with PersistentCache(args.path, max_bytes=args.max_bytes) as cache:
+        if args.command == 'compact':
+            before = os.path.getsize(args.path)
+            deleted = cache.compact()
+            print(f"Evicted {deleted} entries; file size {before} -> {os.path.getsize(args.path)} bytes.")
+        elif args.command == 'clear':
+            cache.clear()
+            cache.compact()
+        print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from .normalizer import (
+    normalize_text, bangla_to_ipa_converter, NormalizerPipeline, DEFAULT_STAGES,
+    StageProfile, add_stage_hook, remove_stage_hook, enable_persistent_cache,
+    worker_pool, remove_punctuation, _graphemes_to_ipa,
+)
+from .telemetry import get_error_telemetry, record_error
+
+# Input formats, and the file extensions that select them when no format is given.
+FORMATS = ('text', 'tsv', 'jsonl')
+_format_by_extension = {'.tsv': 'tsv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+class _Converter:
+    """
+    What the command applies to each text: `normalize_text` (or a
+    `NormalizerPipeline` of `stages`), followed by the IPA conversion of
+    `bangla_to_ipa_converter` when `ipa` is set. Pickles as its arguments.
+    """
+
+    def __init__(self, stages=None, ipa=False):
+        self.stages = stages
+        self.ipa = ipa
+        self._normalize = normalize_text if stages is None else NormalizerPipeline(stages)
+
+    def __reduce__(self):
+        return self.__class__, (self.stages, self.ipa)
+
+    def __call__(self, text):
+        if not self.ipa:
+            return self._normalize(text)
+        if self.stages is None:
+            return bangla_to_ipa_converter(text)
+        return _graphemes_to_ipa(self._normalize(remove_punctuation(text)))
+
+
+_worker_converter = None
+
+
+def _set_worker_converter(converter):
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_block(texts, profile=False, converter=None):
+    """
+    Convert `texts`, returning the results, the per-stage totals when
+    `profile` is set, and the failures recorded meanwhile. A text that
+    raises is returned unchanged.
+    """
+    convert = converter or _worker_converter
+    hook = StageProfile() if profile else None
+    if hook is not None:
+        add_stage_hook(hook)
+    try:
+        results = []
+        for text in texts:
+            try:
+                results.append(convert(text))
+            except Exception as e:
+                record_error('cli', text, e)
+                results.append(text)
+    finally:
+        if hook is not None:
+            remove_stage_hook(hook)
+    return results, hook.stages if hook is not None else None, get_error_telemetry().drain()
+
+
+def _split_record(line, fmt, column, field):
+    """
+    Return (record, text) for one input line: the parsed record and the text
+    to convert in it, or None if it holds nothing to convert.
+    """
+    if fmt == 'text':
+        return None, line
+    if fmt == 'tsv':
+        cells = line.split('\t')
+        return cells, cells[column] if -len(cells) <= column < len(cells) else None
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        if line.strip():
+            record_error('jsonl', line, e)
+        return None, None
+    text = record.get(field) if isinstance(record, dict) else None
+    return record, text if isinstance(text, str) else None
+
+
+def _join_record(line, record, converted, fmt, column, output_field):
+    if converted is None:
+        return line
+    if fmt == 'text':
+        return converted
+    if fmt == 'tsv':
+        record[column] = converted
+        return '\t'.join(record)
+    record[output_field] = converted
+    return json.dumps(record, ensure_ascii=False)
+
+
+class _Progress:
+    """
+    Throughput counters, reported to `stream` at most once per `interval`
+    seconds while `enabled`.
+    """
+
+    def __init__(self, stream, enabled, interval=1.0):
+        self.stream = stream
+        self.enabled = enabled
+        self.interval = interval
+        self.records = 0
+        self.chars = 0
+        self.start = self._last = time.perf_counter()
+
+    def update(self, records, chars):
+        self.records += records
+        self.chars += chars
+        now = time.perf_counter()
+        if self.enabled and now - self._last >= self.interval:
+            self._last = now
+            self.stream.write(f"\r{self.summary(now)}")
+            self.stream.flush()
+
+    def summary(self, now=None):
+        seconds = (now or time.perf_counter()) - self.start
+        rate = self.records / seconds if seconds else 0.0
+        char_rate = self.chars / seconds if seconds else 0.0
+        return f"{self.records} records, {self.chars} chars in {seconds:.1f}s ({rate:.0f} records/s, {char_rate:.0f} chars/s)"
+
+    def finish(self):
+        if self.enabled:
+            self.stream.write(f"\r{self.summary()}\n")
+            self.stream.flush()
+
+
+def _blocks(lines, size):
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) == size:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def run(lines, write, fmt='text', column=0, field='text', output_field=None, stages=None, ipa=False,
+        workers=1, chunksize=256, header=False, profile=False, progress=None):
+    """
+    Convert every line of `lines` (without line endings) and pass each output
+    line to `write`, in input order. Returns a stats dict: record and
+    character counts, the number of records changed, throughput, failures per
+    stage and, with `profile`, per-stage totals (see `StageProfile`).
+
+    Lines are read and converted `chunksize` at a time; with `workers` > 1,
+    blocks are converted in a process pool with at most two blocks per
+    worker in flight, so memory stays bounded however long the input is.
+    """
+    converter = _Converter(stages, ipa)
+    output_field = output_field or field
+    telemetry = get_error_telemetry()
+    stats = {'records': 0, 'converted': 0, 'changed': 0, 'chars_in': 0, 'chars_out': 0}
+    stage_totals = {}
+    start = time.perf_counter()
+
+    lines = iter(lines)
+    if header:
+        for line in lines:
+            write(line)
+            break
+
+    def emit(block, parsed, result):
+        results, stages_seen, errors = result
+        if errors is not None:
+            telemetry.merge(errors)
+        for name, totals in (stages_seen or {}).items():
+            merged = stage_totals.setdefault(name, dict.fromkeys(totals, 0))
+            for key, value in totals.items():
+                merged[key] += value
+        converted = iter(results)
+        chars = 0
+        for line, (record, text) in zip(block, parsed):
+            output = _join_record(line, record, None if text is None else next(converted), fmt, column, output_field)
+            if text is not None:
+                stats['converted'] += 1
+            stats['changed'] += output != line
+            stats['chars_out'] += len(output)
+            chars += len(line)
+            write(output)
+        stats['records'] += len(block)
+        stats['chars_in'] += chars
+        if progress is not None:
+            progress.update(len(block), chars)
+
+    def parse(block):
+        parsed = [_split_record(line, fmt, column, field) for line in block]
+        return parsed, [text for _, text in parsed if text is not None]
+
+    if workers <= 1:
+        for block in _blocks(lines, chunksize):
+            parsed, texts = parse(block)
+            emit(block, parsed, _convert_block(texts, profile, converter))
+    else:
+        pending = deque()
+        with worker_pool(workers, initializer=_set_worker_converter, initargs=(converter,)) as pool:
+            for block in _blocks(lines, chunksize):
+                parsed, texts = parse(block)
+                pending.append((block, parsed, pool.apply_async(_convert_block, (texts, profile))))
+                if len(pending) >= 2 * workers:
+                    block, parsed, result = pending.popleft()
+                    emit(block, parsed, result.get())
+            while pending:
+                block, parsed, result = pending.popleft()
+                emit(block, parsed, result.get())
+
+    seconds = time.perf_counter() - start
+    stats['seconds'] = seconds
+    stats['records_per_second'] = stats['records'] / seconds if seconds else None
+    stats['chars_per_second'] = stats['chars_in'] / seconds if seconds else None
+    stats['errors'] = {stage: entry['count'] for stage, entry in telemetry.stats().items()}
+    if profile:
+        stats['stages'] = dict(sorted(stage_totals.items(), key=lambda item: item[1]['seconds'], reverse=True))
+    return stats
+
+
+def _open_input(path):
+    if path == '-':
+        return open(sys.stdin.fileno(), encoding='utf-8', closefd=False)
+    return open(path, encoding='utf-8')
+
+
+def _open_output(path):
+    if path is None or path == '-':
+        return open(sys.stdout.fileno(), 'w', encoding='utf-8', closefd=False)
+    return open(path, 'w', encoding='utf-8')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Normalize a plain-text, TSV or JSONL file line by line with bangla_normalizer."
+    )
+    parser.add_argument('input', help="input file, or - for stdin")
+    parser.add_argument('-o', '--output', help="output file (default: stdout)")
+    parser.add_argument('-f', '--format', choices=FORMATS,
+                        help="input format (default: from the file extension, else text)")
+    parser.add_argument('--column', type=int, default=0, help="TSV column to normalize, from 0 (default: 0)")
+    parser.add_argument('--header', action='store_true', help="copy the first line through unchanged")
+    parser.add_argument('--field', default='text', help="JSONL field to normalize (default: text)")
+    parser.add_argument('--output-field', help="JSONL field to write the result to (default: --field)")
+    parser.add_argument('--stages', nargs='+', metavar='STAGE',
+                        help=f"run only these stages, in this order (default: {' '.join(DEFAULT_STAGES)})")
+    parser.add_argument('--ipa', action='store_true', help="emit IPA, as bangla_to_ipa_converter does")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="worker processes; 0 means one per CPU (default: 1)")
+    parser.add_argument('--chunksize', type=int, default=256, help="lines per unit of work (default: 256)")
+    parser.add_argument('--cache', metavar='PATH', help="persistent cache file to read and fill")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="write nothing; print counts, throughput, failures and per-stage totals as JSON")
+    progress_group = parser.add_mutually_exclusive_group()
+    progress_group.add_argument('--progress', action='store_true', default=None,
+                                help="report progress on stderr (default: when stderr is a terminal)")
+    progress_group.add_argument('-q', '--quiet', action='store_false', dest='progress',
+                                help="report nothing on stderr")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = _format_by_extension.get(os.path.splitext(args.input)[1].lower(), 'text')
+    if args.stages is not None:
+        try:
+            NormalizerPipeline(args.stages)
+        except ValueError as e:
+            parser.error(str(e))
+    workers = args.workers or os.cpu_count() or 1
+    show_progress = sys.stderr.isatty() if args.progress is None else args.progress
+    if args.cache:
+        enable_persistent_cache(args.cache)
+
+    try:
+        progress = _Progress(sys.stderr, show_progress)
+        with _open_input(args.input) as source:
+            lines = (line.rstrip('\n') for line in source)
+            options = dict(fmt=fmt, column=args.column, field=args.field, output_field=args.output_field,
+                           stages=args.stages, ipa=args.ipa, workers=workers, chunksize=max(1, args.chunksize),
+                           header=args.header, progress=progress)
+            if args.dry_run:
+                stats = run(lines, lambda line: None, profile=True, **options)
+            else:
+                with _open_output(args.output) as target:
+                    stats = run(lines, lambda line: target.write(line + '\n'), **options)
+        progress.finish()
+
+        if args.dry_run:
+            json.dump(stats, sys.stdout, ensure_ascii=False, indent=2)
+            sys.stdout.write('\n')
+        elif args.progress is not False and stats['errors']:
+            failures = ', '.join(f"{stage}: {count}" for stage, count in stats['errors'].items())
+            sys.stderr.write(f"Failures left unchanged: {failures}\n")
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly like other filters.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
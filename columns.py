@@ -0,0 +1,83 @@
+from . import normalizer
+from .extractor import get_pattern
+from .normalizer import (
+    normalize_batch, normalize_spans, translate_english_word, remove_extra_spaces, SHORT_TEXT_LENGTH,
+)
+
+_default_pipeline = (normalize_spans, translate_english_word, remove_extra_spaces)
+
+
+def _passes_through(text):
+    """
+    Whether `normalize_text(text)` is certain to return `text` unchanged.
+    """
+    return (
+        len(text) <= SHORT_TEXT_LENGTH and get_pattern('may_normalize').search(text) is None
+        and '  ' not in text and text[:1] != ' ' and text[-1:] != ' ' and "টা টা" not in text
+    )
+
+
+def normalize_values(values, pipeline=None, workers=1, chunksize=None):
+    """
+    Return a list with `normalize_text` (or `pipeline`, a
+    `NormalizerPipeline`) applied to every string in the iterable `values`.
+    Values that are not strings (None, NaN, ...) are returned as they are.
+
+    Each distinct string is looked at once. Short strings that cannot
+    change are passed through without running the pipeline; the rest are
+    normalized with `normalize_batch` over `workers` processes in chunks of
+    `chunksize`.
+    """
+    values = list(values)
+    distinct = dict.fromkeys(value for value in values if isinstance(value, str))
+    skip_unchanged = pipeline is None and tuple(normalizer.NORMALIZATION_PIPELINE) == _default_pipeline
+    texts = [text for text in distinct if not (skip_unchanged and _passes_through(text))]
+    normalized = {}
+    if texts:
+        if pipeline is None:
+            results = normalize_batch(texts, workers, chunksize)
+        else:
+            results = pipeline.normalize_batch(texts, workers, chunksize)
+        normalized = dict(zip(texts, results))
+    return [normalized.get(value, value) if isinstance(value, str) else value for value in values]
+
+
+def normalize_column(column, pipeline=None, workers=1, chunksize=None):
+    """
+    Normalize a column of strings: a pandas Series, a NumPy array or any
+    sequence. Row for row, the result equals applying `normalize_text` (or
+    `pipeline`) to each string; missing values and other non-strings are
+    kept as they are. See `normalize_values` for how the work is cut down.
+
+    A Series comes back as a Series with the same index and name (and the
+    same dtype if it is a pandas string dtype, otherwise object), an array
+    as an object array of the same shape, and anything else as a list.
+    pandas and NumPy are only imported when such a column is passed in.
+    """
+    module = type(column).__module__.split('.')[0]
+    if module == 'pandas':
+        import pandas as pd
+
+        if isinstance(column, pd.Series):
+            results = normalize_values(column.tolist(), pipeline, workers, chunksize)
+            dtype = column.dtype if isinstance(column.dtype, pd.StringDtype) else object
+            return pd.Series(results, index=column.index, name=column.name, dtype=dtype)
+    if module == 'numpy':
+        import numpy as np
+
+        if isinstance(column, np.ndarray):
+            results = np.empty(column.size, dtype=object)
+            results[:] = normalize_values(column.ravel().tolist(), pipeline, workers, chunksize)
+            return results.reshape(column.shape)
+    return normalize_values(column, pipeline, workers, chunksize)
+
+
+def normalize_dataframe(frame, columns, pipeline=None, workers=1, chunksize=None):
+    """
+    Return a copy of the pandas DataFrame `frame` with each of `columns`
+    normalized by `normalize_column`.
+    """
+    frame = frame.copy()
+    for name in columns:
+        frame[name] = normalize_column(frame[name], pipeline, workers, chunksize)
+    return frame
@@ -584,429 +584,6 @@ english_to_bengali_phonetic_map = {
 }
 
 
-bangla_to_ipa = {
-    # Independent vowels
-    'অ': 'ɔ',
-    'আ': 'aː',
-    'ই': 'i',
-    'ঈ': 'iː',
-    'উ': 'u',
-    'ঊ': 'uː',
-    'ঋ': 'ri',
-    'এ': 'ɛ',
-    'ঐ': 'oi',
-    'ও': 'o',
-    'ঔ': 'ou',
-
-    # Dependent vowel signs (kars)
-    'া': 'aː',
-    'ি': 'i',
-    'ী': 'iː',
-    'ু': 'u',
-    'ূ': 'uː',
-    'ৃ': 'ri',
-    'ে': 'ɛ',
-    'ৈ': 'oi',
-    'ো': 'o',
-    'ৌ': 'ou',
-
-    # Consonants
-    'ক': 'k',
-    'খ': 'kʰ',
-    'গ': 'ɡ',
-    'ঘ': 'ɡʰ',
-    'ঙ': 'ŋ',
-    'চ': 'tʃ',
-    'ছ': 'tʃʰ',
-    'জ': 'dʒ',
-    'ঝ': 'dʒʰ',
-    'ঞ': 'ŋ',
-    'ট': 'ʈ',
-    'ঠ': 'ʈʰ',
-    'ড': 'ɖ',
-    'ঢ': 'ɖʰ',
-    'ণ': 'ɳ',
-    'ত': 't̪',
-    'থ': 't̪ʰ',
-    'দ': 'd̪',
-    'ধ': 'd̪ʰ',
-    'ন': 'n',
-    'প': 'p',
-    'ফ': 'pʰ',
-    'ব': 'b',
-    'ভ': 'bʰ',
-    'ম': 'm',
-    'য': 'dʒ', 
-    'র': 'r',
-    'ল': 'l',
-    'শ': 'ʃ',
-    'ষ': 'ʃ',
-    'স': 's',
-    'হ': 'h',
-    'ড়': 'ɽ',
-    'ঢ়': 'ɽʰ',
-    'য়': 'j',  
-    'ৎ': 't', 
-
-    # Special symbols and diacritics
-    'ং': 'ŋ',  # Anusvara: nasalization
-    'ঃ': 'h',  # Visarga: voiceless breath
-    'ঁ': '̃',  # Chandrabindu: nasalization marker
-    "্": "",  # halant, cancels the inherent vowel
-    " ": " ",
-}
-
-# The extensive dictionary of conjuncts
-bangla_conjuncts_to_ipa = {
-    "য়": "j",
-    'ড়': 'ɽ',
-    'ঢ়': 'ɽʰ',
-    'র': 'r',
-    # ক series
-    'ক্ক': 'kk',
-    'ক্ট': 'kʈ',
-    'ক্ট্র': 'kʈr',
-    'ক্ত': 'kt̪',
-    'ক্ত্র': 'kt̪r',
-    'ক্ব': 'kb',
-    'ক্ম': 'km',
-    'ক্য': 'kj',
-    'ক্র': 'kr',
-    'ক্ল': 'kl',
-    'ক্ষ': 'kʃ',  #'kʰj'
-    'ক্ষ্ণ': 'kʃn',
-    'ক্ষ্ব': 'kʃb',
-    'ক্ষ্ম': 'kʃm',
-    'ক্ষ্ম্য': 'kʃmj',
-    'ক্ষ্য': 'kʃj',
-    'ক্স': 'ks',
-
-    # খ series
-    'খ্য': 'kʰj',
-    'খ্র': 'kʰr',
-
-    # গ series
-    'গ্‌ণ': 'gn',
-    'গ্ধ': 'gd̪ʰ',
-    'গ্ধ্য': 'gd̪ʰj',
-    'গ্ধ্র': 'gd̪ʰr',
-    'গ্ন': 'gn',
-    'গ্ন্য': 'gnj',
-    'গ্ব': 'gb',
-    'গ্ম': 'gm',
-    'গ্য': 'gj',
-    'গ্র': 'gr',
-    'গ্র্য': 'grj',
-    'গ্ল': 'gl',
-
-    # ঘ series
-    'ঘ্ন': 'gʰn',
-    'ঘ্য': 'gʰj',
-    'ঘ্র': 'gʰr',
-
-    # ঙ series
-    'ঙ্ক': 'ŋk',
-    'ঙ্‌ক্ত': 'ŋkt̪',
-    'ঙ্ক্য': 'ŋkj',
-    'ঙ্ক্ষ': 'ŋkʃ',
-    'ঙ্খ': 'ŋkʰ',
-    'ঙ্গ': 'ŋg',
-    'ঙ্গ্য': 'ŋgj',
-    'ঙ্ঘ': 'ŋgʰ',
-    'ঙ্ঘ্য': 'ŋgʰj',
-    'ঙ্ঘ্র': 'ŋgʰr',
-    'ঙ্ম': 'ŋm',
-
-    # চ series
-    'চ্চ': 't͡ʃt͡ʃ',
-    'চ্ছ': 't͡ʃt͡ʃʰ',
-    'চ্ছ্ব': 't͡ʃt͡ʃʰb',
-    'চ্ছ্র': 't͡ʃt͡ʃʰr',
-    'চ্ঞ': 't͡ʃn',
-    'চ্ব': 't͡ʃb',
-    'চ্য': 't͡ʃj',
-
-    # জ series
-    'জ্জ': 'd͡ʒd͡ʒ',
-    'জ্জ্ব': 'd͡ʒd͡ʒb',
-    'জ্ঝ': 'd͡ʒd͡ʒʰ',
-    'জ্ঞ': 'd͡ʒn',  
-    'জ্ব': 'd͡ʒb',
-    'জ্য': 'd͡ʒj',
-    'জ্র': 'd͡ʒr',
-
-    # ঞ series
-    'ঞ্চ': 'nt͡ʃ',
-    'ঞ্ছ': 'nt͡ʃʰ',
-    'ঞ্জ': 'nd͡ʒ',
-    'ঞ্ঝ': 'nd͡ʒʰ',
-
-    # ট series
-    'ট্ট': 'ʈʈ',
-    'ট্ব': 'ʈb',
-    'ট্ম': 'ʈm',
-    'ট্য': 'ʈj',
-    'ট্র': 'ʈr',
-
-    # ড series
-    'ড্ড': 'ɖɖ',
-    'ড্ব': 'ɖb',
-    'ড্য': 'ɖj',
-    'ড্র': 'ɖr',
-    'ড়্গ': 'ɽg',
-
-    # ঢ series
-    'ঢ্য': 'ɖʰj',
-    'ঢ্র': 'ɖʰr',
-
-    # ণ series
-    'ণ্ট': 'nʈ',
-    'ণ্ঠ': 'nʈʰ',
-    'ণ্ঠ্য': 'nʈʰj',
-    'ণ্ড': 'nɖ',
-    'ণ্ড্য': 'nɖj',
-    'ণ্ড্র': 'nɖr',
-    'ণ্ঢ': 'nɖʰ',
-    'ণ্ণ': 'nn',
-    'ণ্ব': 'nb',
-    'ণ্ম': 'nm',
-    'ণ্য': 'nj',
-
-    # ত series
-    'ৎক': 't̪k',
-    'ত্ত': 't̪t̪',
-    'ত্ত্ব': 't̪t̪b',
-    'ত্ত্য': 't̪t̪j',
-    'ত্থ': 't̪t̪ʰ',
-    'ত্ন': 't̪n',
-    'ত্ব': 't̪b',
-    'ত্ম': 't̪m',
-    'ত্ম্য': 't̪mj',
-    'ত্য': 't̪j',
-    'ত্র': 't̪r',
-    'ত্র্য': 't̪rj',
-    'ৎল': 't̪l',
-    'ৎস': 't̪s',
-
-    # থ series
-    'থ্ব': 't̪ʰb',
-    'থ্য': 't̪ʰj',
-    'থ্র': 't̪ʰr',
-
-    # দ series
-    'দ্গ': 'd̪g',
-    'দ্ঘ': 'd̪gʰ',
-    'দ্দ': 'd̪d̪',
-    'দ্দ্ব': 'd̪d̪b',
-    'দ্ধ': 'd̪d̪ʰ',
-    'দ্ব': 'd̪b',
-    'দ্ভ': 'd̪bʰ',
-    'দ্ভ্র': 'd̪bʰr',
-    'দ্ম': 'd̪m',
-    'দ্য': 'd̪j',
-    'দ্র': 'd̪r',
-    'দ্র্য': 'd̪rj',
-
-    # ধ series
-    'ধ্ন': 'd̪ʰn',
-    'ধ্ব': 'd̪ʰb',
-    'ধ্ম': 'd̪ʰm',
-    'ধ্য': 'd̪ʰj',
-    'ধ্র': 'd̪ʰr',
-
-    # ন series
-    'ন্ট': 'nʈ',
-    'ন্ট্র': 'nʈr',
-    'ন্ঠ': 'nʈʰ',
-    'ন্ড': 'nɖ',
-    'ন্ড্র': 'nɖr',
-    'ন্ত': 'nt̪',
-    'ন্ত্ব': 'nt̪b',
-    'ন্ত্য': 'nt̪j',
-    'ন্ত্র': 'nt̪r',
-    'ন্ত্র্য': 'nt̪rj',
-    'ন্থ': 'nt̪ʰ',
-    'ন্থ্র': 'nt̪ʰr',
-    'ন্দ': 'nd̪',
-    'ন্দ্য': 'nd̪j',
-    'ন্দ্ব': 'nd̪b',
-    'ন্দ্র': 'nd̪r',
-    'ন্ধ': 'nd̪ʰ',
-    'ন্ধ্য': 'nd̪ʰj',
-    'ন্ধ্র': 'nd̪ʰr',
-    'ন্ন': 'nn',
-    'ন্ব': 'nb',
-    'ন্ম': 'nm',
-    'ন্য': 'nj',
-
-    # প series
-    'প্ট': 'pʈ',
-    'প্ত': 'pt̪',
-    'প্ন': 'pn',
-    'প্প': 'pp',
-    'প্য': 'pj',
-    'প্র': 'pr',
-    'প্র্য': 'prj',
-    'প্ল': 'pl',
-    'প্স': 'ps',
-
-    # ফ series
-    'ফ্র': 'pʰr',
-    'ফ্ল': 'pʰl',
-
-    # ব series
-    'ব্জ': 'bd͡ʒ',
-    'ব্দ': 'bd̪',
-    'ব্ধ': 'bd̪ʰ',
-    'ব্ব': 'bb',
-    'ব্য': 'bj',
-    'ব্র': 'br',
-    'ব্ল': 'bl',
-
-    # ভ series
-    'ভ্ব': 'bʰb',
-    'ভ্য': 'bʰj',
-    'ভ্র': 'bʰr',
-
-    # ম series
-    'ম্ন': 'mn',
-    'ম্প': 'mp',
-    'ম্প্র': 'mpr',
-    'ম্ফ': 'mpʰ',
-    'ম্ব': 'mb',
-    'ম্ব্র': 'mbr',
-    'ম্ভ': 'mbʰ',
-    'ম্ভ্র': 'mbʰr',
-    'ম্ম': 'mm',
-    'ম্য': 'mj',
-    'ম্র': 'mr',
-    'ম্ল': 'ml',
-
-    # য series
-    'য্য': 'jj',
-
-    # র series (র as the first consonant)
-    'র্ক': 'rk',
-    'র্ক্য': 'rkj',
-    'র্গ্য': 'rgj',
-    'র্ঘ্য': 'rgʰj',
-    'র্চ্য': 'rt͡ʃj',
-    'র্জ্য': 'rd͡ʒj',
-    'র্ণ্য': 'rnj',
-    'র্ত্য': 'rt̪j',
-    'র্থ্য': 'rt̪ʰj',
-    'র্ব্য': 'rbj',
-    'র্ম্য': 'rmj',
-    'র্শ্য': 'rʃj',
-    'র্ষ্য': 'rʃj',
-    'র্হ্য': 'rhj',
-    'র্খ': 'rkʰ',
-    'র্গ': 'rg',
-    'র্গ্র': 'rgr',
-    'র্ঘ': 'rgʰ',
-    'র্চ': 'rt͡ʃ',
-    'র্ছ': 'rt͡ʃʰ',
-    'র্জ': 'rd͡ʒ',
-    'র্ঝ': 'rd͡ʒʰ',
-    'র্ট': 'rʈ',
-    'র্ড': 'rɖ',
-    'র্ণ': 'rna',
-    'র্ত': 'rt̪',
-    'র্ত্র': 'rt̪r',
-    'র্থ': 'rt̪ʰ',
-    'র্দ': 'rd̪',
-    'র্দ্ব': 'rd̪b',
-    'র্দ্র': 'rd̪r',
-    'র্ধ': 'rd̪ʰ',
-    'র্ধ্ব': 'rd̪ʰb',
-    'র্ন': 'rn',
-    'র্প': 'rp',
-    'র্ফ': 'rpʰ',
-    'র্ভ': 'rbʰ',
-    'র্ম': 'rm',
-    'র্য': 'rj',
-    'র্ল': 'rl',
-    'র্শ': 'rʃ',
-    'র্শ্ব': 'rʃb',
-    'র্ষ': 'rʃ',
-    'র্স': 'rs',
-    'র্হ': 'rh',
-    'র্ঢ্য': 'rɖʰj',
-
-    # ল series
-    'ল্ক': 'lk',
-    'ল্ক্য': 'lkj',
-    'ল্গ': 'lg',
-    'ল্ট': 'lʈ',
-    'ল্ড': 'lɖ',
-    'ল্প': 'lp',
-    'ল্‌ফ': 'lpʰ',
-    'ল্ব': 'lb',
-    'ল্‌ভ': 'lbʰ',
-    'ল্ম': 'lm',
-    'ল্য': 'lj',
-    'ল্ল': 'll',
-
-    # শ series
-    'শ্চ': 'ʃt͡ʃ',
-    'শ্ছ': 'ʃt͡ʃʰ',
-    'শ্ন': 'ʃn',
-    'শ্ব': 'ʃb',
-    'শ্ম': 'ʃm',
-    'শ্য': 'ʃj',
-    'শ্র': 'ʃr',
-    'শ্ল': 'ʃl',
-
-    # ষ series
-    'ষ্ক': 'ʃk',
-    'ষ্ক্র': 'ʃkr',
-    'ষ্ট': 'ʃʈ',
-    'ষ্ট্য': 'ʃʈj',
-    'ষ্ট্র': 'ʃʈr',
-    'ষ্ঠ': 'ʃʈʰ',
-    'ষ্ঠ্য': 'ʃʈʰj',
-    'ষ্ণ': 'ʃn',
-    'ষ্প': 'ʃp',
-    'ষ্প্র': 'ʃpr',
-    'ষ্ফ': 'ʃpʰ',
-    'ষ্ব': 'ʃb',
-    'ষ্ম': 'ʃm',
-    'ষ্য': 'ʃj',
-
-    # স series
-    'স্ক': 'sk',
-    'স্ক্র': 'skr',
-    'স্খ': 'skʰ',
-    'স্ট': 'sʈ',
-    'স্ট্র': 'sʈr',
-    'স্ত': 'st̪',
-    'স্ত্ব': 'st̪b',
-    'স্ত্য': 'st̪j',
-    'স্ত্র': 'st̪r',
-    'স্থ': 'st̪ʰ',
-    'স্থ্য': 'st̪ʰj',
-    'স্ন': 'sn',
-    'স্প': 'sp',
-    'স্প্র': 'spr',
-    'স্প্‌ল': 'spl',
-    'স্ফ': 'spʰ',
-    'স্ব': 'sb',
-    'স্ম': 'sm',
-    'স্য': 'sj',
-    'স্র': 'sr',
-    'স্ল': 'sl',
-
-    # হ series
-    'হ্ণ': 'hn',
-    'হ্ন': 'hn',
-    'হ্ব': 'hb',
-    'হ্ম': 'hm',
-    'হ্য': 'hj',
-    'হ্র': 'hr',
-    'হ্ল': 'hl',
-    'হৃ': 'hr̩' 
-}
-
 hundred_suffix = "শো"
 thousand = "হাজার"
 hour_suffix = "টা"
@@ -1018,3 +595,12 @@ temp_suffix_K = 'ডিগ্রি কেলভিন'
 percentage_suffix = 'পার্সেন্ট'
 minus_suffix = 'মাইনাস'
 ratio_suffix = 'অনুপাত'
+
+
+def __getattr__(name):
+    # The IPA tables are only needed by `bangla_to_ipa_converter`, so they
+    # live in ipa_data.py and are loaded on first access.
+    if name in ('bangla_to_ipa', 'bangla_conjuncts_to_ipa'):
+        from . import ipa_data
+        return getattr(ipa_data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
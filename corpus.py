@@ -0,0 +1,289 @@
+import json
+import mmap
+import os
+import sys
+import time
+
+from .cache import library_version, pipeline_fingerprint
+from .normalizer import normalize_text, enable_persistent_cache, worker_pool
+from .telemetry import get_error_telemetry, record_error
+
+# Layout of a checkpoint manifest; bumped when its fields change meaning.
+MANIFEST_FORMAT = 1
+MANIFEST_NAME = 'manifest.json'
+
+
+def _map_file(f):
+    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mapped, 'madvise'):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
+
+
+def plan_shards(path, shard_bytes=64 << 20):
+    """
+    Split the file at `path` into (start, end) byte ranges of about
+    `shard_bytes` each, every range ending just after a newline (or at the
+    end of the file), so no line is split between shards.
+    """
+    if shard_bytes < 1:
+        raise ValueError("shard_bytes must be positive")
+    size = os.path.getsize(path)
+    if not size:
+        return []
+    shards = []
+    with open(path, 'rb') as f, _map_file(f) as mapped:
+        start = 0
+        while start < size:
+            newline = mapped.find(b'\n', min(start + shard_bytes, size) - 1)
+            end = size if newline == -1 else newline + 1
+            shards.append((start, end))
+            start = end
+    return shards
+
+
+def _write_atomically(path, data, temporary_path=None):
+    temporary_path = temporary_path or f"{path}.tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, path)
+
+
+def _concatenate_atomically(paths, output_path, separate_lines=False):
+    """
+    Write the files at `paths` one after another to `output_path`,
+    atomically. With `separate_lines`, a newline is inserted after a file
+    that does not end with one when another file follows, so its last line
+    does not run into the next file's first. Returns the bytes written.
+    """
+    import shutil
+
+    written = 0
+    unterminated = False
+    temporary_path = f"{output_path}.tmp"
+    with open(temporary_path, 'wb') as out:
+        for path in paths:
+            size = os.path.getsize(path)
+            if not size:
+                continue
+            if unterminated:
+                out.write(b'\n')
+                written += 1
+            with open(path, 'rb') as part:
+                shutil.copyfileobj(part, out, 1 << 20)
+                part.seek(-1, os.SEEK_END)
+                unterminated = separate_lines and part.read(1) != b'\n'
+            written += size
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(temporary_path, output_path)
+    return written
+
+
+def _normalize_line(line, normalize):
+    """
+    Normalize one line of bytes, keeping its line ending. Lines that are not
+    valid UTF-8, or that fail to normalize, are returned unchanged.
+    """
+    try:
+        text = line.decode('utf-8')
+    except UnicodeDecodeError as e:
+        record_error('corpus', line[:200], e)
+        return line
+    body = text.rstrip('\r\n')
+    try:
+        normalized = normalize(body)
+    except Exception as e:
+        record_error('corpus', body, e)
+        return line
+    return (normalized + text[len(body):]).encode('utf-8')
+
+
+def process_shard(input_path, start, end, output_path, normalize=normalize_text):
+    """
+    Normalize every line in bytes `start` to `end` of `input_path` and write
+    the result to `output_path`, atomically: the file only appears once it
+    is complete. The input is read through a memory map one line at a time,
+    so memory does not grow with the shard. Returns the shard's counts.
+    """
+    shard_start = time.perf_counter()
+    lines = 0
+    bytes_out = 0
+    temporary_path = f"{output_path}.tmp"
+    with open(input_path, 'rb') as f, _map_file(f) as mapped, open(temporary_path, 'wb') as out:
+        position = start
+        while position < end:
+            newline = mapped.find(b'\n', position, end)
+            line_end = end if newline == -1 else newline + 1
+            normalized = _normalize_line(mapped[position:line_end], normalize)
+            out.write(normalized)
+            bytes_out += len(normalized)
+            lines += 1
+            position = line_end
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(temporary_path, output_path)
+    return {'lines': lines, 'bytes_out': bytes_out, 'seconds': time.perf_counter() - shard_start}
+
+
+def _process_shard_task(task):
+    index, input_path, start, end, output_path, normalize = task
+    return index, process_shard(input_path, start, end, output_path, normalize), get_error_telemetry().drain()
+
+
+def _source_identity(input_path, shard_bytes, normalize):
+    stat = os.stat(input_path)
+    return {
+        'input': os.path.abspath(input_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'shard_bytes': shard_bytes,
+        'normalizer': pipeline_fingerprint([normalize]),
+        'version': library_version(),
+    }
+
+
+def load_manifest(output_dir):
+    """
+    Return the checkpoint manifest in `output_dir`, or None if there is none.
+    """
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _save_manifest(output_dir, manifest):
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+    _write_atomically(os.path.join(output_dir, MANIFEST_NAME), data)
+
+
+def _shard_done(output_dir, shard):
+    if not shard['done']:
+        return False
+    try:
+        return os.path.getsize(os.path.join(output_dir, shard['output'])) == shard['bytes_out']
+    except OSError:
+        return False
+
+
+def process_corpus(input_path, output_dir, shard_bytes=64 << 20, workers=1, normalize=normalize_text,
+                   restart=False, progress=None):
+    """
+    Normalize the file at `input_path` line by line into numbered output
+    shards in `output_dir`, recording each finished shard in a checkpoint
+    manifest (`manifest.json`) there.
+
+    Shards are cut at line boundaries (see `plan_shards`) and processed by
+    `workers` processes, each memory-mapping the input itself. Every output
+    shard and every manifest update is written atomically, so after an
+    interruption, calling this again with the same arguments only processes
+    the shards that had not finished. A manifest for a different input file,
+    shard size, `normalize` function or normalization code raises ValueError
+    unless `restart` is set, which starts over. `normalize` must be picklable
+    when `workers` > 1. `progress`, if given, is called with the manifest
+    entry of each shard as it completes.
+
+    Returns the manifest. Use `merge_shards` to join the shards into one file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    identity = _source_identity(input_path, shard_bytes, normalize)
+    manifest = None if restart else load_manifest(output_dir)
+    if manifest is not None and (manifest.get('format') != MANIFEST_FORMAT or manifest.get('source') != identity):
+        raise ValueError(
+            f"{output_dir} holds a checkpoint for another input, shard size or normalizer; "
+            "pass restart=True to start over"
+        )
+    if manifest is None:
+        manifest = {
+            'format': MANIFEST_FORMAT,
+            'source': identity,
+            'shards': [
+                {'index': index, 'start': start, 'end': end, 'output': f"part-{index:05d}.txt",
+                 'done': False, 'lines': None, 'bytes_out': None, 'seconds': None}
+                for index, (start, end) in enumerate(plan_shards(input_path, shard_bytes))
+            ],
+        }
+        _save_manifest(output_dir, manifest)
+
+    shards = manifest['shards']
+    tasks = [
+        (shard['index'], input_path, shard['start'], shard['end'],
+         os.path.join(output_dir, shard['output']), normalize)
+        for shard in shards if not _shard_done(output_dir, shard)
+    ]
+    telemetry = get_error_telemetry()
+
+    def finish(index, counts, errors):
+        if errors is not None:
+            telemetry.merge(errors)
+        shards[index].update(counts, done=True)
+        _save_manifest(output_dir, manifest)
+        if progress is not None:
+            progress(shards[index])
+
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        for task in tasks:
+            finish(*_process_shard_task(task))
+    else:
+        with worker_pool(workers) as pool:
+            for result in pool.imap_unordered(_process_shard_task, tasks):
+                finish(*result)
+    return manifest
+
+
+def merge_shards(output_dir, output_path):
+    """
+    Concatenate the output shards of a finished `process_corpus` run, in
+    order, into `output_path` (written atomically). Raises ValueError if a
+    shard is missing or unfinished.
+    """
+    manifest = load_manifest(output_dir)
+    if manifest is None:
+        raise ValueError(f"no checkpoint manifest in {output_dir}")
+    unfinished = [shard['index'] for shard in manifest['shards'] if not _shard_done(output_dir, shard)]
+    if unfinished:
+        raise ValueError(f"{len(unfinished)} shards are not finished, starting with shard {unfinished[0]}")
+    _concatenate_atomically([os.path.join(output_dir, shard['output']) for shard in manifest['shards']], output_path)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Normalize a large text file into checkpointed shards, resuming an interrupted run."
+    )
+    parser.add_argument('input', help="UTF-8 text file, one text per line")
+    parser.add_argument('output_dir', help="directory for the output shards and the checkpoint manifest")
+    parser.add_argument('--shard-mb', type=float, default=64, help="approximate shard size in MiB (default: 64)")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="worker processes; 0 means one per CPU (default: 1)")
+    parser.add_argument('--merge', metavar='PATH', help="when every shard is done, join them into this file")
+    parser.add_argument('--restart', action='store_true', help="ignore an existing checkpoint and start over")
+    parser.add_argument('--cache', metavar='PATH', help="persistent cache file to read and fill")
+    args = parser.parse_args(argv)
+
+    if args.cache:
+        enable_persistent_cache(args.cache)
+
+    def report(shard):
+        sys.stderr.write(f"shard {shard['index']}: {shard['lines']} lines in {shard['seconds']:.1f}s\n")
+
+    try:
+        manifest = process_corpus(args.input, args.output_dir, max(1, int(args.shard_mb * (1 << 20))),
+                                  args.workers or os.cpu_count() or 1, restart=args.restart, progress=report)
+    except ValueError as e:
+        sys.exit(str(e))
+    shards = manifest['shards']
+    print(f"{sum(shard['done'] for shard in shards)} of {len(shards)} shards done in {args.output_dir}")
+    if args.merge:
+        merge_shards(args.output_dir, args.merge)
+        print(f"Merged into {args.merge}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,7 @@
 import re
 
-def extract_mobile_numbers(text):
-    """
-    Extracts Bangladeshi mobile numbers from the input text.
-    Handles optional country code (+88 or ৮৮), different digit lengths (7 or 8 digits),
-    Bengali and English digits, and optional trailing hyphens.
-    Returns a list of matched numbers after filtering out those with invalid characters.
-    """
-    pattern = r'(?<![\d০-৯.])((?:\+?[৮8][৮8])?(?:[0০][1১১][3-9৩-৯])(?:[0-9০-৯]{2}[-]?[0-9০-৯]{6}|[0-9০-৯]{7,8})(?:-)?)(?![\d০-৯_])'
-    matches = re.findall(pattern, text)
-    matches = [m for m in matches if '.' not in m and '_' not in m]
-    return matches
-
 
-def extract_bengali_dates(text):
-    """
-    Extracts dates written in Bangla or English format with various separators and styles.
-    Supports formats with month names, slashes, hyphens, optional suffixes, and years.
-    Returns only the matched full date strings from the input text.
-    """
+def _date_pattern():
     bengali_digits = r'[০-৯]'
     english_digits = r'\d'
 
@@ -59,8 +42,161 @@ def extract_bengali_dates(text):
         )
         (?=\s|,|$|।|;|[?!])
     '''
-    matches = [m[0] for m in re.findall(date_pattern, text, re.VERBOSE | re.IGNORECASE)]
-    return matches
+    return date_pattern
+
+
+def _distance_pattern():
+    number_pattern_str = r"[\d০-৯]+(?:\.[\d০-৯]+)?"
+
+    units_list = [
+        "km", "hm", "dam", "cm", "mm", "µm", "um", "nm", "pm", "dm",
+        "mi", "fur", "ch", "yd", "ft", "in",
+        "m", '\"', "\'"
+    ]
+    units_pattern_str = r"(?:" + "|".join(units_list) + r")"
+
+    single_measurement_pattern = f"{number_pattern_str}{units_pattern_str}"
+
+    dimension_separator_pattern = r"\s*[xX×]\s*"
+    dimension_pattern = (
+        f"{number_pattern_str}{units_pattern_str}"
+        f"{dimension_separator_pattern}"
+        f"{number_pattern_str}{units_pattern_str}"
+    )
+
+    regex_for_findall = f"{dimension_pattern}|{single_measurement_pattern}"
+    return regex_for_findall
+
+
+def _taka_amount_pattern():
+    taka_pattern = (
+        r'(?:'
+        r'৳\s*[০-৯0-9,]+(?:\.[০-৯0-9]+)?(?:\s*(?:টাকা(?:র)?|লক্ষ|কোটি))?'
+        r'|'
+        r'(?<![৳\d০-৯.,])'
+        r'[০-৯0-9,]+(?:\.[০-৯0-9]+)?\s*টাকা(?:র)?'
+        r')'
+    )
+    return taka_pattern
+
+
+def _ratio_pattern():
+    num_pattern = r'[০-৯0-9,]+(?:\.[০-৯0-9]+)?'
+    pattern = rf'''
+        (?<![\d০-৯.,])
+        (
+            {num_pattern}(?:\s*[:ঃ-]\s*{num_pattern})+
+            |
+            {num_pattern}\s*থেকে\s*{num_pattern}
+            |
+            {num_pattern}\s*অনুপাত\s*{num_pattern}
+        )
+        (?:\s*(?:অনুপাতে|রেশিওতে))?
+        (?!\s*[:ঃ-])
+    '''
+    return pattern
+
+
+# Every pattern used to find or parse non-standard words, by stable name, as
+# (source, flags). `get_pattern` compiles each one once, on first use, and
+# `warm_up` compiles all of them up front.
+PATTERN_SOURCES = {
+    'mobile_numbers': (r'(?<![\d০-৯.])((?:\+?[৮8][৮8])?(?:[0০][1১১][3-9৩-৯])(?:[0-9০-৯]{2}[-]?[0-9০-৯]{6}|[0-9০-৯]{7,8})(?:-)?)(?![\d০-৯_])', 0),
+    'dates': (_date_pattern(), re.VERBOSE | re.IGNORECASE),
+    'numbers': (r'(?<![0-9০-৯.,৳])(?:[-−]?)([0-9০-৯]+(?:,[0-9০-৯]{3})*(?:\.[0-9০-৯]+)?|[0-9০-৯]+\.[0-9০-৯]+)(?![0-9০-৯.,%])', 0),
+    'distance': (_distance_pattern(), 0),
+    'time': (r'(?<![0-9০-৯])([0-9০-৯]{1,2}:[0-9০-৯]{2}(?::[0-9০-৯]{2})?(?:\s*(?:AM|PM|A\.M\.|P\.M\.))?(?:\s*(?:টায়|মিনিটে))?)(?![0-9০-৯])', re.IGNORECASE),
+    'taka_amounts': (_taka_amount_pattern(), 0),
+    'digit': (r'[০-৯0-9]', 0),
+    'percentages': (r'(?<![0-9০-৯.,])([-−]?[০-৯0-9,]+(?:\.[০-৯0-9]+)?)\s*(?:%|শতাংশ)(?![0-9০-৯.])', 0),
+    'temperatures': (r'[-−]?[০-৯0-9]+(?:\.[০-৯0-9]+)?(?:\s*°(?:\s*(?:[CcFfKk]|সে\.?(?:\s*লসিয়াসে?)?)?)?|\s*ডিগ্রি(?:\s*সেলসিয়াসে?|\s*ফারেনহাইটে?)?)', 0),
+    'ratios': (_ratio_pattern(), re.VERBOSE),
+    'ordinals': (r'(?<!\S)([০-৯0-9]+(?:,[0-9০-৯]+)*(?:ম|য়|য়|লা|রা|শে|ই|র্থ|তম)|\d+(?:,\d+)*(?:st|nd|rd|th))(?=\s|[।,;:.?!]|$)', 0),
+    'year_then_context': (r'(\d{4})\s*(সাল|সন)', 0),
+    'context_then_year': (r'(সাল|সন)\s*(\d{4})', 0),
+    'year_then_inflected_context': (r'(\d{4})\s*(সালের|এর\s*দশকে|সাল,)', 0),
+    'sentences': (r'([^।?!]+[।?!]?)', 0),
+    'any_digit': (r'\d', 0),
+    # Characters whose lowercase contains an ASCII letter.
+    'latin_letter': (r'[A-Za-z\u0130\u212a]', 0),
+    'phone_separators': (r'[-._\s]', 0),
+    # Any character outside a whitelist that cannot make `normalize_text`
+    # change a short text: Bengali letters and signs (not digits), ' ',
+    # joiners, dashes, quotes and ASCII punctuation other than ','. Digits
+    # and commas trigger span stages, Latin letters `translate_english_word`
+    # and other whitespace `remove_extra_spaces` (see `columns`).
+    'may_normalize': (r'[^ \u0980-\u09e5\u09f0-\u09ff\u0964\u0965\u200c\u200d\u2013\u2014\u2018-\u201d!-+\--/:-@\[-`{-~]', 0),
+    'temperature_number': (r'([-−]?\s*[০-৯0-9,]+(?:\.[০-৯0-9]+)?)', 0),
+    'ordinal_number': (r'([০-৯0-9,]+)(?:ম|য়|লা|রা|শে|ই|র্থ|তম|st|nd|rd|th)', re.IGNORECASE),
+    'date_day_first': (r'\s*(\d{1,2})([/-])(\d{1,2})\2(\d{4})\s*', 0),
+    'date_year_first': (r'\s*(\d{4})([/-])(\d{1,2})\2(\d{1,2})\s*', 0),
+    'date_month_name': (r'\s*(\d{1,2})(?:st|nd|rd|th|লা|ই|শে|ঠা|এ|রা)?[\s/-]*([^\s\d,/-]+)[\s,/-]*(\d{4})\s*', re.IGNORECASE),
+    'time_components': (r'\s*(\d{1,2})(?::(\d{1,2})(?::(\d{1,2}))?)?\s*(?:(a\.?m\.?|এ\.?এম\.?)|(p\.?m\.?|পি\.?এম\.?))?\s*(?:টায়|টায়|টায|মিনিটে)?\s*', re.IGNORECASE),
+}
+
+_compiled_patterns = {}
+
+
+def get_pattern(name):
+    """
+    Returns the compiled pattern registered under `name` in
+    `PATTERN_SOURCES`, compiling it the first time it is asked for.
+    """
+    try:
+        return _compiled_patterns[name]
+    except KeyError:
+        source, flags = PATTERN_SOURCES[name]
+        pattern = _compiled_patterns[name] = re.compile(source, flags)
+        return pattern
+
+
+def warm_up():
+    """
+    Compiles every registered pattern now instead of on first use.
+    Call it right after import, or as the initializer of worker processes;
+    children forked after a warm-up inherit the compiled patterns.
+    """
+    for name in PATTERN_SOURCES:
+        get_pattern(name)
+
+
+def extract_mobile_numbers(text):
+    """
+    Extracts Bangladeshi mobile numbers from the input text.
+    Handles optional country code (+88 or ৮৮), different digit lengths (7 or 8 digits),
+    Bengali and English digits, and optional trailing hyphens.
+    Returns a list of matched numbers after filtering out those with invalid characters.
+    """
+    return [text[start:end] for start, end in iter_mobile_numbers(text)]
+
+
+def iter_mobile_numbers(text):
+    """
+    Yields the (start, end) span of every match `extract_mobile_numbers`
+    returns.
+    """
+    for match in get_pattern('mobile_numbers').finditer(text):
+        number = match.group(1)
+        if '.' not in number and '_' not in number:
+            yield match.span(1)
+
+
+def extract_bengali_dates(text):
+    """
+    Extracts dates written in Bangla or English format with various separators and styles.
+    Supports formats with month names, slashes, hyphens, optional suffixes, and years.
+    Returns only the matched full date strings from the input text.
+    """
+    return [text[start:end] for start, end in iter_bengali_dates(text)]
+
+
+def iter_bengali_dates(text):
+    """
+    Yields the (start, end) span of every match `extract_bengali_dates`
+    returns.
+    """
+    for match in get_pattern('dates').finditer(text):
+        yield match.span(1)
 
 
 def extract_numbers(text):
@@ -69,10 +205,17 @@ def extract_numbers(text):
     Skips those within other patterns like dates or phone numbers.
     Supports optional commas and decimal points.
     """
-    pattern = r'(?<![0-9০-৯.,৳])(?:[-−]?)([0-9০-৯]+(?:,[0-9০-৯]{3})*(?:\.[0-9০-৯]+)?|[0-9০-৯]+\.[0-9০-৯]+)(?![0-9০-৯.,%])'
-    matches = re.findall(pattern, text)
-    matches = [m for m in matches if m]
-    return matches
+    return [text[start:end] for start, end in iter_numbers(text)]
+
+
+def iter_numbers(text):
+    """
+    Yields the (start, end) span of every match `extract_numbers` returns.
+    A leading minus sign is not part of the span.
+    """
+    for match in get_pattern('numbers').finditer(text):
+        if match.group(1):
+            yield match.span(1)
 
 
 def extract_distance(sentence: str) -> list[str]:
@@ -88,28 +231,15 @@ def extract_distance(sentence: str) -> list[str]:
     Returns:
         list[str]: All matched NSW strings (e.g., ['১০ ফুট', '৫ ইঞ্চি', '২০ মিটার', '২.৫ কিলোমিটার'])
     """
-    number_pattern_str = r"[\d০-৯]+(?:\.[\d০-৯]+)?"
+    return [sentence[start:end] for start, end in iter_distance(sentence)]
 
-    units_list = [
-        "km", "hm", "dam", "cm", "mm", "µm", "um", "nm", "pm", "dm",
-        "mi", "fur", "ch", "yd", "ft", "in",
-        "m", '\"', "\'"
-    ]
-    units_pattern_str = r"(?:" + "|".join(units_list) + r")"
 
-    single_measurement_pattern = f"{number_pattern_str}{units_pattern_str}"
-
-    dimension_separator_pattern = r"\s*[xX×]\s*"
-    dimension_pattern = (
-        f"{number_pattern_str}{units_pattern_str}"
-        f"{dimension_separator_pattern}"
-        f"{number_pattern_str}{units_pattern_str}"
-    )
-
-    regex_for_findall = f"{dimension_pattern}|{single_measurement_pattern}"
-
-    nsw_found_list = re.findall(regex_for_findall, sentence)
-    return nsw_found_list
+def iter_distance(sentence: str):
+    """
+    Yields the (start, end) span of every match `extract_distance` returns.
+    """
+    for match in get_pattern('distance').finditer(sentence):
+        yield match.span()
 
 
 def extract_time(text):
@@ -117,9 +247,15 @@ def extract_time(text):
     Extracts time expressions in HH:MM or HH:MM:SS format using Bengali or English digits.
     Also handles AM/PM formats and optional suffixes like 'টায়' or 'মিনিটে'.
     """
-    pattern = r'(?<![0-9০-৯])([0-9০-৯]{1,2}:[0-9০-৯]{2}(?::[0-9০-৯]{2})?(?:\s*(?:AM|PM|A\.M\.|P\.M\.))?(?:\s*(?:টায়|মিনিটে))?)(?![0-9০-৯])'
-    matches = re.findall(pattern, text, re.IGNORECASE)
-    return matches
+    return [text[start:end] for start, end in iter_time(text)]
+
+
+def iter_time(text):
+    """
+    Yields the (start, end) span of every match `extract_time` returns.
+    """
+    for match in get_pattern('time').finditer(text):
+        yield match.span(1)
 
 
 def extract_taka_amounts(text):
@@ -127,17 +263,20 @@ def extract_taka_amounts(text):
     Extracts monetary amounts in Bangladeshi Taka.
     Supports formats with the ৳ symbol, Bengali or English numerals, and words like টাকা, লক্ষ, কোটি.
     """
-    taka_pattern = (
-        r'(?:'
-        r'৳\s*[০-৯0-9,]+(?:\.[০-৯0-9]+)?(?:\s*(?:টাকা(?:র)?|লক্ষ|কোটি))?'
-        r'|'
-        r'(?<![৳\d০-৯.,])'
-        r'[০-৯0-9,]+(?:\.[০-৯0-9]+)?\s*টাকা(?:র)?'
-        r')'
-    )
-    matches = re.findall(taka_pattern, text)
-    matches = [m.strip() for m in matches if re.search(r'[০-৯0-9]', m)]
-    return matches
+    return [text[start:end] for start, end in iter_taka_amounts(text)]
+
+
+def iter_taka_amounts(text):
+    """
+    Yields the (start, end) span of every match `extract_taka_amounts`
+    returns, trimmed of surrounding whitespace.
+    """
+    for match in get_pattern('taka_amounts').finditer(text):
+        amount = match.group()
+        if get_pattern('digit').search(amount):
+            start = match.start() + len(amount) - len(amount.lstrip())
+            end = match.end() - len(amount) + len(amount.rstrip())
+            yield start, end
 
 
 def extract_percentages(text):
@@ -145,9 +284,16 @@ def extract_percentages(text):
     Extracts percentage values using % or শতাংশ with Bengali or English digits.
     Supports optional decimals and minus signs.
     """
-    pattern = r'(?<![0-9০-৯.,])([-−]?[০-৯0-9,]+(?:\.[০-৯0-9]+)?)\s*(?:%|শতাংশ)(?![0-9০-৯.])'
-    matches = re.findall(pattern, text)
-    return [m + ('%' if '%' in full_match else ' শতাংশ') for m, full_match in zip(matches, re.findall(r'((?<![0-9০-৯.,])[-−]?[০-৯0-9,]+(?:\.[০-৯0-9]+)?\s*(?:%|শতাংশ)(?![0-9০-৯.]))', text))]
+    return [match.group(1) + ('%' if '%' in match.group() else ' শতাংশ') for match in get_pattern('percentages').finditer(text)]
+
+
+def iter_percentages(text):
+    """
+    Yields the (start, end) span of every percentage in `text`, covering the
+    number together with its `%` or `শতাংশ`.
+    """
+    for match in get_pattern('percentages').finditer(text):
+        yield match.span()
 
 
 def extract_temperatures(text):
@@ -155,9 +301,16 @@ def extract_temperatures(text):
     Extracts temperature values written in various Bangla or mixed formats.
     Supports degrees (°), Celsius/Fahrenheit/Kelvin indicators, and variants like "ডিগ্রি সেলসিয়াস", "F", etc.
     """
-    temperature_pattern =  r'[-−]?[০-৯0-9]+(?:\.[০-৯0-9]+)?(?:\s*°(?:\s*(?:[CcFfKk]|সে\.?(?:\s*লসিয়াসে?)?)?)?|\s*ডিগ্রি(?:\s*সেলসিয়াসে?|\s*ফারেনহাইটে?)?)'
-    matches = re.findall(temperature_pattern, text)
-    return matches
+    return [text[start:end] for start, end in iter_temperatures(text)]
+
+
+def iter_temperatures(text):
+    """
+    Yields the (start, end) span of every match `extract_temperatures`
+    returns.
+    """
+    for match in get_pattern('temperatures').finditer(text):
+        yield match.span()
 
 
 def extract_ratios(text):
@@ -165,23 +318,17 @@ def extract_ratios(text):
     Extracts ratio expressions like X:Y, XঃY, X থেকে Y, and X অনুপাত Y.
     Supports Bengali and English digits, decimals, and optional ratio suffixes.
     """
-    num_pattern = r'[০-৯0-9,]+(?:\.[০-৯0-9]+)?'
-    pattern = rf'''
-        (?<![\d০-৯.,])
-        (
-            {num_pattern}(?:\s*[:ঃ-]\s*{num_pattern})+
-            |
-            {num_pattern}\s*থেকে\s*{num_pattern}
-            |
-            {num_pattern}\s*অনুপাত\s*{num_pattern}
-        )
-        (?:\s*(?:অনুপাতে|রেশিওতে))?
-        (?!\s*[:ঃ-])
-    '''
-    matches = re.findall(pattern, text, re.VERBOSE)
-    matches = [m[0] if isinstance(m, tuple) else m for m in matches]
-    matches = [m for m in matches if any(c in m for c in ':ঃ-') or 'থেকে' in m or 'অনুপাত' in m]
-    return matches
+    return [text[start:end] for start, end in iter_ratios(text)]
+
+
+def iter_ratios(text):
+    """
+    Yields the (start, end) span of every match `extract_ratios` returns.
+    """
+    for match in get_pattern('ratios').finditer(text):
+        ratio = match.group(1)
+        if any(c in ratio for c in ':ঃ-') or 'থেকে' in ratio or 'অনুপাত' in ratio:
+            yield match.span(1)
 
 
 def extract_ordinals(text):
@@ -189,9 +336,15 @@ def extract_ordinals(text):
     Extracts ordinal numbers like ১লা, ২য়, ১০ম, 3rd, etc.
     Supports both Bengali and English forms with optional commas in large numbers.
     """
-    pattern = r'(?<!\S)([০-৯0-9]+(?:,[0-9০-৯]+)*(?:ম|য়|য়|লা|রা|শে|ই|র্থ|তম)|\d+(?:,\d+)*(?:st|nd|rd|th))(?=\s|[।,;:.?!]|$)'
-    matches = re.findall(pattern, text)
-    return matches
+    return [text[start:end] for start, end in iter_ordinals(text)]
+
+
+def iter_ordinals(text):
+    """
+    Yields the (start, end) span of every match `extract_ordinals` returns.
+    """
+    for match in get_pattern('ordinals').finditer(text):
+        yield match.span(1)
 
 
 def extract_years_with_context(text):
@@ -199,21 +352,15 @@ def extract_years_with_context(text):
     Extracts years with contextual words like সাল, সন, দশকে, etc.
     Handles variations where the word comes before or after the year.
     """
-    patterns = [
-        r'(\d{4})\s*(সাল|সন)',
-        r'(সাল|সন)\s*(\d{4})',
-        r'(\d{4})\s*(সালের|এর\s*দশকে|সাল,)'
-    ]
+    return [text[start:end] for start, end in iter_years_with_context(text)]
+
 
-    years = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            for match in matches:
-                if isinstance(match, tuple):
-                    year = match[0] if len(match[0]) == 4 else match[1]
-                    years.append(year)
-                else:
-                    years.append(match)
-
-    return years
+def iter_years_with_context(text):
+    """
+    Yields the (start, end) span of every match `extract_years_with_context`
+    returns. Spans come pattern by pattern, so they are not sorted and the
+    same year may appear more than once.
+    """
+    for name in ('year_then_context', 'context_then_year', 'year_then_inflected_context'):
+        for match in get_pattern(name).finditer(text):
+            yield match.span(1) if len(match.group(1)) == 4 else match.span(2)
@@ -0,0 +1,329 @@
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+
+from .cache import library_version
+from .corpus import plan_shards, process_shard, _write_atomically, _concatenate_atomically
+from .normalizer import normalize_text, NormalizerPipeline
+
+# A job directory, shared by every node, holds:
+#   job.json            the manifest: input files, their pieces and shard of each piece
+#   claims/             shard-NNNNN.M: attempt M at shard NNNNN, created exclusively
+#   outputs/            piece-NNNNNN.aM.txt: a piece normalized by attempt M
+#   done/               shard-NNNNN.json: which outputs a finished attempt wrote
+# Only exclusive file creation and atomic renames are relied on, which a
+# shared local or network filesystem provides.
+
+JOB_FORMAT = 1
+JOB_MANIFEST = 'job.json'
+
+
+def shard_of(path_index, start, num_shards):
+    """
+    Deterministic shard of the piece starting at byte `start` of input file
+    number `path_index`: the same on every node, run and Python version.
+    """
+    digest = hashlib.sha256(f"{path_index}:{start}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big') % num_shards
+
+
+def _count_lines(path, start, end):
+    lines = 0
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        last = b''
+        while remaining:
+            block = f.read(min(remaining, 1 << 20))
+            if not block:
+                break
+            lines += block.count(b'\n')
+            remaining -= len(block)
+            last = block
+    # A last line without a newline still counts.
+    return lines + (last[-1:] != b'\n' if end > start else 0)
+
+
+def _file_identity(path):
+    stat = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def load_job(job_dir):
+    """
+    Return the manifest of the job in `job_dir`.
+    """
+    with open(os.path.join(job_dir, JOB_MANIFEST), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def create_job(job_dir, input_paths, num_shards, piece_bytes=16 << 20, stages=None):
+    """
+    Plan a job that normalizes `input_paths` line by line in `num_shards`
+    shards, and write its manifest to `job_dir`.
+
+    Every file is cut at line boundaries into pieces of about `piece_bytes`
+    (see `corpus.plan_shards`), and each piece goes to the shard given by
+    `shard_of`. The manifest records every piece with its line count, so
+    the merge can prove no line was lost or duplicated. `stages` selects a
+    `NormalizerPipeline` (default: `normalize_text`). Creating a job that
+    already exists with the same plan returns its manifest; a different
+    plan raises ValueError.
+    """
+    if num_shards < 1:
+        raise ValueError("num_shards must be positive")
+    files = [_file_identity(path) for path in input_paths]
+    if stages is not None:
+        stages = list(NormalizerPipeline(stages).stages)
+    settings = {'num_shards': num_shards, 'piece_bytes': piece_bytes, 'stages': stages,
+                'version': library_version(), 'files': files}
+    try:
+        existing = load_job(job_dir)
+    except FileNotFoundError:
+        existing = None
+    if existing is not None:
+        if {key: existing.get(key) for key in settings} != settings:
+            raise ValueError(f"{job_dir} already holds a different job")
+        return existing
+
+    pieces = []
+    for path_index, identity in enumerate(files):
+        for start, end in plan_shards(identity['path'], piece_bytes):
+            pieces.append({
+                'index': len(pieces), 'file': path_index, 'start': start, 'end': end,
+                'lines': _count_lines(identity['path'], start, end),
+                'shard': shard_of(path_index, start, num_shards),
+            })
+    manifest = dict(settings, format=JOB_FORMAT, pieces=pieces)
+    for name in ('claims', 'outputs', 'done'):
+        os.makedirs(os.path.join(job_dir, name), exist_ok=True)
+    _write_atomically(os.path.join(job_dir, JOB_MANIFEST),
+                      json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    return manifest
+
+
+def _check_job(manifest):
+    if manifest.get('format') != JOB_FORMAT:
+        raise ValueError("the job manifest has an unsupported format")
+    if manifest['version'] != library_version():
+        raise ValueError("the job was planned with different library code or conversion tables")
+    for identity in manifest['files']:
+        if _file_identity(identity['path']) != identity:
+            raise ValueError(f"{identity['path']} changed after the job was planned")
+
+
+def _done_path(job_dir, shard):
+    return os.path.join(job_dir, 'done', f"shard-{shard:05d}.json")
+
+
+def _attempts(job_dir, shard):
+    """
+    Return the attempt numbers claimed for `shard`, highest last.
+    """
+    prefix = f"shard-{shard:05d}."
+    return sorted(
+        int(name[len(prefix):]) for name in os.listdir(os.path.join(job_dir, 'claims'))
+        if name.startswith(prefix) and name[len(prefix):].isdigit()
+    )
+
+
+def _claim_path(job_dir, shard, attempt):
+    return os.path.join(job_dir, 'claims', f"shard-{shard:05d}.{attempt}")
+
+
+def claim_shard(job_dir, shard, node_id, lease_seconds=600):
+    """
+    Try to claim `shard` for `node_id`. Returns the attempt number on
+    success, or None if the shard is done or another node holds a live
+    claim. A claim whose file has not been touched for `lease_seconds` has
+    expired and is taken over by starting the next attempt. Exactly one
+    node can create any attempt, so a shard is never claimed twice at once.
+    """
+    if os.path.exists(_done_path(job_dir, shard)):
+        return None
+    attempts = _attempts(job_dir, shard)
+    if attempts:
+        try:
+            age = time.time() - os.path.getmtime(_claim_path(job_dir, shard, attempts[-1]))
+        except FileNotFoundError:
+            return None
+        if age < lease_seconds:
+            return None
+    attempt = attempts[-1] + 1 if attempts else 1
+    try:
+        fd = os.open(_claim_path(job_dir, shard, attempt), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return None
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'node': node_id, 'host': socket.gethostname(), 'pid': os.getpid(), 'time': time.time()}, f)
+    return attempt
+
+
+def process_job_shard(job_dir, shard, attempt, manifest=None, normalize=None):
+    """
+    Normalize every piece of `shard` under claim `attempt`, then record the
+    shard as done. The claim is touched after every piece to keep its lease.
+    """
+    manifest = manifest or load_job(job_dir)
+    if normalize is None:
+        normalize = normalize_text if manifest['stages'] is None else NormalizerPipeline(manifest['stages'])
+    claim = _claim_path(job_dir, shard, attempt)
+    outputs = {}
+    for piece in manifest['pieces']:
+        if piece['shard'] != shard:
+            continue
+        output = f"piece-{piece['index']:06d}.a{attempt}.txt"
+        counts = process_shard(manifest['files'][piece['file']]['path'], piece['start'], piece['end'],
+                               os.path.join(job_dir, 'outputs', output), normalize)
+        if counts['lines'] != piece['lines']:
+            raise RuntimeError(f"piece {piece['index']}: read {counts['lines']} lines, planned {piece['lines']}")
+        outputs[piece['index']] = {'output': output, 'lines': counts['lines'], 'bytes': counts['bytes_out'],
+                                   'sha256': _file_sha256(os.path.join(job_dir, 'outputs', output))}
+        os.utime(claim)
+    done = _done_path(job_dir, shard)
+    _write_atomically(done, json.dumps({'attempt': attempt, 'pieces': outputs}, indent=2).encode('utf-8'),
+                      temporary_path=f"{done}.{attempt}.tmp")
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def run_node(job_dir, node_id=None, lease_seconds=600, max_shards=None, progress=None):
+    """
+    Claim and process shards of the job in `job_dir` until none is left to
+    claim (or `max_shards` are done), and return the shards processed.
+    Start one call per node, or several local processes to simulate nodes;
+    each starts at a different shard, chosen from `node_id`, to spread
+    contention. `progress`, if given, is called with each finished shard.
+    """
+    manifest = load_job(job_dir)
+    _check_job(manifest)
+    if node_id is None:
+        node_id = f"{socket.gethostname()}-{os.getpid()}"
+    normalize = normalize_text if manifest['stages'] is None else NormalizerPipeline(manifest['stages'])
+    num_shards = manifest['num_shards']
+    first = int.from_bytes(hashlib.sha256(node_id.encode()).digest()[:8], 'big') % num_shards
+    processed = []
+    for offset in range(num_shards):
+        if max_shards is not None and len(processed) >= max_shards:
+            break
+        shard = (first + offset) % num_shards
+        attempt = claim_shard(job_dir, shard, node_id, lease_seconds)
+        if attempt is None:
+            continue
+        process_job_shard(job_dir, shard, attempt, manifest, normalize)
+        processed.append(shard)
+        if progress is not None:
+            progress(shard)
+    return processed
+
+
+def job_status(job_dir, lease_seconds=600):
+    """
+    Count the shards of the job in `job_dir` that are done, held by a live
+    claim, held by an expired claim, or not claimed yet.
+    """
+    manifest = load_job(job_dir)
+    status = {'shards': manifest['num_shards'], 'done': 0, 'running': 0, 'expired': 0, 'pending': 0}
+    now = time.time()
+    for shard in range(manifest['num_shards']):
+        attempts = _attempts(job_dir, shard)
+        if os.path.exists(_done_path(job_dir, shard)):
+            status['done'] += 1
+        elif not attempts:
+            status['pending'] += 1
+        elif now - os.path.getmtime(_claim_path(job_dir, shard, attempts[-1])) < lease_seconds:
+            status['running'] += 1
+        else:
+            status['expired'] += 1
+    return status
+
+
+def merge_job(job_dir, output_path):
+    """
+    Check the outputs of a finished job and concatenate them, in input file
+    and line order, into `output_path` (written atomically). A newline is
+    inserted after an input file whose last line has none, so it does not
+    run into the next file. Returns the number of lines written.
+
+    Every piece must have been recorded by a finished shard with as many
+    lines as the plan counted in the input, and its output file must still
+    have the recorded SHA-256. Otherwise ValueError is raised and nothing is
+    written.
+    """
+    manifest = load_job(job_dir)
+    _check_job(manifest)
+    records = {}
+    missing = []
+    for shard in range(manifest['num_shards']):
+        try:
+            with open(_done_path(job_dir, shard), encoding='utf-8') as f:
+                records.update((int(index), piece) for index, piece in json.load(f)['pieces'].items())
+        except FileNotFoundError:
+            missing.append(shard)
+    if missing:
+        raise ValueError(f"{len(missing)} shards are not done, starting with shard {missing[0]}")
+
+    for piece in manifest['pieces']:
+        record = records.get(piece['index'])
+        if record is None or record['lines'] != piece['lines']:
+            raise ValueError(f"piece {piece['index']} is missing or has the wrong number of lines")
+        if _file_sha256(os.path.join(job_dir, 'outputs', record['output'])) != record['sha256']:
+            raise ValueError(f"{record['output']} does not match its checksum")
+
+    outputs = [os.path.join(job_dir, 'outputs', records[piece['index']]['output']) for piece in manifest['pieces']]
+    _concatenate_atomically(outputs, output_path, separate_lines=True)
+    return sum(piece['lines'] for piece in manifest['pieces'])
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Normalize files as a sharded job shared by several nodes.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    create = commands.add_parser('create', help="plan a job")
+    create.add_argument('job_dir')
+    create.add_argument('inputs', nargs='+', help="UTF-8 text files, one text per line")
+    create.add_argument('-n', '--shards', type=int, required=True, help="number of shards")
+    create.add_argument('--piece-mb', type=float, default=16, help="approximate piece size in MiB (default: 16)")
+    create.add_argument('--stages', nargs='+', metavar='STAGE', help="run only these stages, in this order")
+    run = commands.add_parser('run', help="claim and process shards until none is left")
+    run.add_argument('job_dir')
+    run.add_argument('--node', help="node name (default: host and pid)")
+    run.add_argument('--lease', type=float, default=600,
+                     help="seconds after which another node's idle claim is taken over (default: 600)")
+    status = commands.add_parser('status', help="count done, running and pending shards")
+    status.add_argument('job_dir')
+    merge = commands.add_parser('merge', help="check the outputs and concatenate them in order")
+    merge.add_argument('job_dir')
+    merge.add_argument('output')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'create':
+            manifest = create_job(args.job_dir, args.inputs, args.shards,
+                                  max(1, int(args.piece_mb * (1 << 20))), args.stages)
+            print(f"{len(manifest['pieces'])} pieces in {manifest['num_shards']} shards")
+        elif args.command == 'run':
+            processed = run_node(args.job_dir, args.node, args.lease,
+                                 progress=lambda shard: sys.stderr.write(f"shard {shard} done\n"))
+            print(f"Processed {len(processed)} shards")
+        elif args.command == 'status':
+            print(json.dumps(job_status(args.job_dir), indent=2))
+        else:
+            lines = merge_job(args.job_dir, args.output)
+            print(f"Merged {lines} lines into {args.output}")
+    except (ValueError, FileNotFoundError) as e:
+        sys.exit(str(e))
+
+
+if __name__ == '__main__':
+    main()
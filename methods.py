@@ -1,15 +1,21 @@
 from .utils import *
 from .conversion_data import *
-from datetime import datetime
-import re
+from .extractor import get_pattern
+from .snapshot import get_table
+from .telemetry import record_error
 
 
 def date_to_word(date):
     """
     Converts a date string to its Bengali word representation.
-    Handles day, month, and year components separately.
+    Handles day, month, and year components separately. A string that is
+    not a valid date (see `extract_date_components_bangla`) is returned
+    unchanged.
     """
-    day, month, year = extract_date_components_bangla(date)
+    components = extract_date_components_bangla(date)
+    if components is None:
+        return date
+    day, month, year = components
     word = ''
     first_half, second_half = separate_year(year)
     if first_half % 1000 == 0:
@@ -46,6 +52,11 @@ def year_to_word(year):
     return word
 
 
+# Words for every value below one thousand, indexed by value, built once so
+# converting a number never recurses below the thousands group.
+below_thousand_words = get_table('below_thousand_words')
+
+
 def convert_integer_to_words(number):
     """
     Converts an integer number to Bengali words.
@@ -54,27 +65,23 @@ def convert_integer_to_words(number):
     if number == 0:
         return "শূন্য"
 
-    word = ""
+    words = []
     if number >= 10 ** 7:
-        crore_part = number // 10 ** 7
-        word += convert_integer_to_words(crore_part) + " " + "কোটি"
+        words.append(convert_integer_to_words(number // 10 ** 7))
+        words.append("কোটি")
         number %= 10 ** 7
     if number >= 10 ** 5:
-        lakh_part = number // 10 ** 5
-        word += " " + convert_integer_to_words(lakh_part) + " " + "লক্ষ"
+        words.append(below_thousand_words[number // 10 ** 5])
+        words.append("লক্ষ")
         number %= 10 ** 5
     if number >= 10 ** 3:
-        thousand_part = number // 10 ** 3
-        word += " " + convert_integer_to_words(thousand_part) + " " + "হাজার"
+        words.append(below_thousand_words[number // 10 ** 3])
+        words.append(thousand)
         number %= 10 ** 3
-    if number >= 100:
-        hundred_part = number // 100
-        word += " " + englishNum[hundred_part] + "শো"
-        number %= 100
     if number > 0:
-        word += " " + englishNum[number]
+        words.append(below_thousand_words[number])
 
-    return word
+    return " ".join(words)
 
 
 def number_to_word(num):
@@ -82,34 +89,22 @@ def number_to_word(num):
     Converts a number string (integer or decimal) to Bengali words.
     Handles negative numbers and decimal points.
     """
-    global number, integer_part, decimal_part
-    minus = 0
-    if '-' in num:
-        num = num.replace('-', '')
-        minus = 1
-
-    if '.' in num:
-        integer_part, decimal_part = num.split('.')[0], num.split(".")[1]
-        integer_part = bangla_to_english_number(integer_part)
-        decimal_part = bangla_to_english_number(decimal_part)
-    else:
-        number = bangla_to_english_number(num)
+    minus = '-' in num or '−' in num
+    if minus:
+        num = num.replace('-', '').replace('−', '')
 
-    if "." not in num:
-        word = convert_integer_to_words(number)
-        if minus==1:
-            return minus_suffix + ' ' + remove_extra_spaces(word.strip())
-        else:
-            return remove_extra_spaces(word.strip())
-
-    else:
-        word = convert_integer_to_words(integer_part)
-        decimal_words = convert_decimal_to_words(decimal_part)
-        word += " দশমিক " + decimal_words
-        if minus == 1:
-            return minus_suffix + ' ' +  remove_extra_spaces(word.strip())
-        else:
-            return remove_extra_spaces(word.strip())
+    parts = num.replace(',', '').translate(bangla_to_english_digits).split('.')
+    try:
+        word = convert_integer_to_words(int(parts[0]))
+        if len(parts) > 1:
+            decimal_words = " ".join(englishNum[int(digit)] for digit in str(int(parts[1])))
+            word += " দশমিক " + decimal_words
+    except ValueError:
+        raise ValueError(f"Could not convert '{num}' to words.") from None
+
+    if minus:
+        return minus_suffix + ' ' + word
+    return word
 
 
 def phone_number_to_word(number_str):
@@ -125,11 +120,11 @@ def phone_number_to_word(number_str):
         has_plus = True
         number_str = number_str[1:]
 
-    cleaned_number = re.sub(r'[-._\s]', '', number_str)
+    cleaned_number = get_pattern('phone_separators').sub('', number_str)
     cleaned_number = cleaned_number.translate(bangla_to_english_digits).translate(english_to_bangla_digits)
 
     if not cleaned_number.isdigit():
-         print(f"Warning: Non-digit characters remaining in phone number '{number_str}' after cleaning.")
+         record_error('phone_number_to_word', number_str, message="non-digit characters remain after cleaning")
          return number_str
 
     word = " ".join(banglaNum.get(digit, digit) for digit in cleaned_number)
@@ -146,59 +141,26 @@ def time_to_word(time_str, text=''):
     Converts a time string to its normalized Bengali word form.
     Handles 12/24 hour formats, AM/PM indicators, and time periods (morning, evening).
     """
+    parsed = parse_time(time_str)
+    if parsed is None:
+        record_error('time_to_word', time_str, message="invalid time")
+        return "ভুল সময় বিন্যাস"
+    hour, minute, second, meridiem = parsed
+
     if not any(word in text for word in ["রাত", "সন্ধ্যা", "বিকেল", "দুপুর", "সকাল", "ভোর"]):
-        period_word = get_bangla_time_period(time_str)
+        period_word = time_period_for_hour(to_24_hour(hour, meridiem))
     else:
         period_word = ''
 
-    bangla_to_english = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
-    cleaned = time_str.translate(bangla_to_english).strip()
-    aakar = False
-    if 'মিনিটে' in time_str:
-        aakar = True
+    aakar = 'মিনিটে' in time_str
 
-    cleaned = re.sub(r'\s*টায়|\s*মিনিটে|\s*টায\s*', '', cleaned)
-    cleaned = cleaned.replace("এ.এম.", "AM").replace("পিএম", "PM") \
-        .replace("a.m.", "AM").replace("p.m.", "PM")
+    result = period_word + " " + number_to_word(str(hour)) + " " + "টা"
+    if minute > 0:
+        result += " " + number_to_word(str(minute)) + " " + ("মিনিটে" if aakar or not second else "মিনিট")
+    if second:
+        result += " " + number_to_word(str(second)) + " " + "সেকেন্ড"
 
-    is_12h = "AM" in cleaned or "PM" in cleaned
-
-    try:
-        time_obj = None
-        possible_formats = ["%I:%M:%S %p", "%I:%M %p", "%H:%M:%S", "%H:%M"]
-        for fmt in possible_formats:
-            try:
-                time_obj = datetime.strptime(cleaned, fmt)
-                break
-            except ValueError:
-                continue
-
-        if time_obj is None:
-            return "ভুল সময় বিন্যাস"
-
-        if is_12h:
-            hour = int(time_obj.strftime("%I"))
-        else:
-            hour = time_obj.hour
-
-        minute = time_obj.minute
-        second = time_obj.second if time_obj.second else None
-
-        hour_word = number_to_word(str(hour))
-        minute_word = number_to_word(str(minute))
-        second_word = number_to_word(str(second)) if second is not None else None
-
-        result = period_word + " " + hour_word + " " + "টা"
-        if minute > 0:
-            result += " " + minute_word + " " + ("মিনিটে" if aakar or not second else "মিনিট")
-        if second:
-            result += " " + second_word + " " + "সেকেন্ড"
-
-        return result
-
-    except Exception as e:
-        print("Error:", e)
-        return "ভুল সময় বিন্যাস"
+    return result
 
 
 def taka_to_word(taka_str):
@@ -259,7 +221,7 @@ def temperature_to_word(temp_str):
     original_temp_str = temp_str
     temp_str = temp_str.strip()
 
-    match = re.match(r'([-−]?\s*[০-৯0-9,]+(?:\.[০-৯0-9]+)?)', temp_str)
+    match = get_pattern('temperature_number').match(temp_str)
     if not match:
         return original_temp_str
 
@@ -295,7 +257,7 @@ def ordinal_to_word(ord_str):
     if ord_str in ordinal_normalization_map:
         return ordinal_normalization_map[ord_str]
 
-    match = re.match(r'([০-৯0-9,]+)(?:ম|য়|লা|রা|শে|ই|র্থ|তম|st|nd|rd|th)', ord_str, re.IGNORECASE)
+    match = get_pattern('ordinal_number').match(ord_str)
     if match:
         num_part = match.group(1)
         suffix = ord_str[len(num_part):]
@@ -326,14 +288,12 @@ def distance_to_word(text):
     Returns:
         str: Text with unit symbols replaced by full Bangla words and digits normalized.
     """
-    sorted_units = sorted(unit_to_bangla_map.items(), key=lambda x: len(x[0]), reverse=True)
     output = text
-    for key, value in sorted_units:
+    for key, value in get_table('units_by_length'):
         if key in text:
             output = output.replace(key, f' {value} ')
 
-    pattern = r'(?<![0-9০-৯.,৳])(?:[-−]?)([0-9০-৯]+(?:,[0-9০-৯]{3})*(?:\.[0-9০-৯]+)?|[0-9০-৯]+\.[0-9০-৯]+)(?![0-9০-৯.,%])'
-    matches = re.findall(pattern, output)
+    matches = get_pattern('numbers').findall(output)
 
     sorted_matches = sorted(list(set(matches)), key=len, reverse=True)
 
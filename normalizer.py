@@ -1,8 +1,16 @@
 from .methods import *
 from .extractor import *
+import os
 import re
-from .conversion_data import bangla_conjuncts_to_ipa, bangla_to_ipa
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from time import perf_counter
+from .cache import SentenceCache, PersistentCache, WordMemo, pipeline_fingerprint
 from .utils import translate_english_word, remove_extra_spaces, remove_punctuation
+from .snapshot import get_table
+from .telemetry import get_error_telemetry, record_error
 
 
 
@@ -89,14 +97,21 @@ def normalize_ratio(text):
     ratios = extract_ratios(text)
     ratios = sorted(list(set(ratios)), key=len, reverse=True)
     for ratio_match in ratios:
-        normalize_val = ratio_match.replace('ঃ', ' এ ')
-        normalize_val = normalize_val.replace(':', ' এ ')
-        normalize_val = normalize_val.replace('-', ' ')
-        normalize_val = normalize_numbers(normalize_val)
-        text = text.replace(ratio_match, normalize_val)
+        text = text.replace(ratio_match, ratio_to_word(ratio_match))
     return text
 
 
+def ratio_to_word(ratio_match):
+    """
+    Converts a ratio expression to Bengali words, reading ':' and 'ঃ' as 'এ'
+    and '-' as a pause.
+    """
+    normalize_val = ratio_match.replace('ঃ', ' এ ')
+    normalize_val = normalize_val.replace(':', ' এ ')
+    normalize_val = normalize_val.replace('-', ' ')
+    return normalize_numbers(normalize_val)
+
+
 def normalize_ordinal(text):
     words = extract_ordinals(text)
     words = sorted(list(set(words)), key=len, reverse=True)
@@ -117,13 +132,154 @@ def normalize_year(text):
     return text
 
 
+# A span stage pairs an extractor's span iterator with the converter for what
+# it matches. `contextual` converters also receive the whole text.
+# `triggers` lists groups of alternatives, each a substring or `ANY_DIGIT`;
+# the finder only runs when every group has an alternative present in the
+# text, so triggers must be necessary for a match. None always runs.
+# `patterns` names the `PATTERN_SOURCES` entries the finder and converter use,
+# so a `NormalizerPipeline` can compile exactly what it needs.
+SpanStage = namedtuple('SpanStage', 'name finder converter contextual triggers patterns', defaults=(False, None, ()))
+
+# Trigger that stands for any Unicode decimal digit (`\d`).
+ANY_DIGIT = '\\d'
+
+_number_chars = (ANY_DIGIT, ',')
+
+# Span stages of `normalize_text` in priority order: when matches of two
+# stages overlap, the stage listed first wins.
+SPAN_STAGES = (
+    SpanStage('distance', iter_distance, distance_to_word, triggers=((ANY_DIGIT,),),
+              patterns=('distance', 'numbers')),
+    SpanStage('temperatures', iter_temperatures, temperature_to_word, triggers=((ANY_DIGIT,), ('°', 'ডিগ্রি')),
+              patterns=('temperatures', 'temperature_number')),
+    SpanStage('time', iter_time, time_to_word, contextual=True, triggers=((ANY_DIGIT,), (':',)),
+              patterns=('time', 'time_components')),
+    SpanStage('dates', iter_bengali_dates, date_to_word, triggers=((ANY_DIGIT,),),
+              patterns=('dates', 'date_day_first', 'date_year_first', 'date_month_name')),
+    SpanStage('phonenumbers', iter_mobile_numbers, phone_number_to_word, triggers=((ANY_DIGIT,),),
+              patterns=('mobile_numbers', 'phone_separators')),
+    SpanStage('taka', iter_taka_amounts, taka_to_word, triggers=(_number_chars, ('৳', 'টাকা')),
+              patterns=('taka_amounts', 'digit')),
+    SpanStage('percentage', iter_percentages, percentage_to_word, triggers=(_number_chars, ('%', 'শতাংশ')),
+              patterns=('percentages',)),
+    SpanStage('ratio', iter_ratios, ratio_to_word, triggers=(_number_chars, (':', 'ঃ', '-', 'থেকে', 'অনুপাত')),
+              patterns=('ratios', 'numbers')),
+    SpanStage('ordinal', iter_ordinals, ordinal_to_word, triggers=((ANY_DIGIT,),),
+              patterns=('ordinals', 'ordinal_number')),
+    SpanStage('year', iter_years_with_context, year_to_word, triggers=((ANY_DIGIT,), ('সাল', 'সন', 'এর')),
+              patterns=('year_then_context', 'context_then_year', 'year_then_inflected_context')),
+    SpanStage('numbers', iter_numbers, number_to_word, triggers=((ANY_DIGIT,),),
+              patterns=('numbers',)),
+)
+
+
+def _triggered(triggers, text, has_digit):
+    """
+    Whether every group of `triggers` has an alternative present in `text`.
+    """
+    for group in triggers:
+        for trigger in group:
+            if has_digit if trigger == ANY_DIGIT else trigger in text:
+                break
+        else:
+            return False
+    return True
+
+
+def normalize_spans(text, stages=SPAN_STAGES, timings=None):
+    """
+    Normalize every match of `stages` in `text` in a single pass.
+
+    Each stage scans the text once, with spans kept by earlier stages masked
+    out. A match is kept only if it does not overlap a kept span, and every
+    kept match is replaced at its own position, so unrelated occurrences of
+    the same substring are never touched. The output is built with one join.
+    A stage whose triggers are absent from the text it would scan is skipped
+    without running its finder.
+
+    If `timings` is a list, a `StageTiming` is appended to it for each stage.
+    An exception escaping a stage is tagged with the stage's name for the
+    error telemetry.
+    """
+    starts, ends, replacements = [], [], []
+    view = text
+    has_digit = None
+    try:
+        for stage in stages:
+            if timings is not None:
+                stage_start = perf_counter()
+            if stage.triggers is not None:
+                if has_digit is None:
+                    has_digit = get_pattern('any_digit').search(view) is not None
+                if not _triggered(stage.triggers, view, has_digit):
+                    if timings is not None:
+                        timings.append(StageTiming(stage.name, perf_counter() - stage_start, 0, 0))
+                    continue
+            converted = {}
+            found = []
+            matches = 0
+            for start, end in stage.finder(view):
+                matches += 1
+                i = bisect_right(starts, start)
+                if (i and ends[i - 1] > start) or (i < len(starts) and starts[i] < end):
+                    continue
+                match = text[start:end]
+                if match not in converted:
+                    if stage.contextual:
+                        converted[match] = stage.converter(match, text)
+                    else:
+                        converted[match] = stage.converter(match)
+                starts.insert(i, start)
+                ends.insert(i, end)
+                replacements.insert(i, converted[match])
+                found.append((start, end, _mask(converted[match], end - start)))
+
+            if found and stage is not stages[-1]:
+                found.sort()
+                view = _join_spans(view, *zip(*found))
+                has_digit = None
+            if timings is not None:
+                timings.append(StageTiming(stage.name, perf_counter() - stage_start, matches, len(found)))
+    except Exception as error:
+        _tag_stage(error, stage.name)
+        raise
+
+    if not starts:
+        return text
+    return _join_spans(text, starts, ends, replacements)
+
+
+def _mask(replacement, length):
+    """
+    Stand-in of `length` characters for a replaced span, so later stages see
+    the same neighbouring characters as they would after a real replacement
+    without shifting any offsets.
+    """
+    if not replacement:
+        return '\0' * length
+    if length == 1:
+        return replacement[0]
+    return replacement[0] + '\0' * (length - 2) + replacement[-1]
+
+
+def _join_spans(text, starts, ends, replacements):
+    pieces = []
+    position = 0
+    for start, end, replacement in zip(starts, ends, replacements):
+        pieces.append(text[position:start])
+        pieces.append(replacement)
+        position = end
+    pieces.append(text[position:])
+    return ''.join(pieces)
+
+
 def split_into_sentences(text):
     """
     Split Bangla `text` into individual sentences while preserving end
     punctuation marks.
     """
-    pattern = r'([^।?!]+[।?!]?)'
-    sentences = re.findall(pattern, text)
+    sentences = get_pattern('sentences').findall(text)
     return [s.strip() for s in sentences if s.strip()]
 
 
@@ -135,61 +291,582 @@ def join_sentences(sentences):
     return ' '.join(sentences)
 
 
-def normalize_text(text):
+# Text-level stages applied, in order, to every chunk `normalize_text`
+# processes.
+NORMALIZATION_PIPELINE = [
+    normalize_spans,
+    translate_english_word,
+    remove_extra_spaces,
+]
+
+
+def process_chunk(chunk):
     """
-    Run the full normalisation pipeline on `text`.  For inputs longer than
-    `THRESHOLD`, the text is processed sentence-by-sentence; any segment that
-    fails to normalise is left unchanged.
-    """
-    THRESHOLD = 150
-
-    normalization_pipeline = [
-        normalize_distance,
-        normalize_temperatures,
-        normalize_time,
-        normalize_dates,
-        normalize_phonenumbers,
-        normalize_taka,
-        normalize_percentage,
-        normalize_ratio,
-        normalize_ordinal,
-        normalize_year,
-        normalize_numbers,
-        translate_english_word,
-        remove_extra_spaces,
-    ]
-
-    def process_chunk(chunk):
+    Apply every function in `NORMALIZATION_PIPELINE` to `chunk`
+    sequentially.
+    """
+    if _stage_hooks:
+        return _process_chunk_timed(chunk, [
+            SPAN_STAGES if normalizer is normalize_spans else normalizer
+            for normalizer in NORMALIZATION_PIPELINE
+        ])
+    processed = chunk
+    try:
+        for normalizer in NORMALIZATION_PIPELINE:
+            processed = normalizer(processed)
+    except Exception as error:
+        _tag_stage(error, _stage_name(normalizer))
+        raise
+    return processed
+
+
+def _stage_name(normalizer):
+    return getattr(normalizer, '__name__', repr(normalizer))
+
+
+def _tag_stage(error, stage):
+    # Remember the innermost stage `error` escaped from, so the telemetry
+    # can count it against that stage.
+    if not hasattr(error, '_normalizer_stage'):
+        try:
+            error._normalizer_stage = stage
+        except AttributeError:
+            pass
+
+
+def _record_failure(value, error, default_stage):
+    record_error(getattr(error, '_normalizer_stage', default_stage), value, error)
+
+
+# One stage's share of processing a chunk. `matches` and `replacements` are
+# None for pipeline functions that are not span stages.
+StageTiming = namedtuple('StageTiming', 'stage seconds matches replacements')
+
+_stage_hooks = []
+
+
+def add_stage_hook(hook):
+    """
+    Register `hook` to be called as `hook(chunk, timings)` after every chunk
+    `process_chunk` normalizes: the whole text for short inputs, each
+    sentence on the long-text path. `timings` lists one `StageTiming` per
+    span stage and per later pipeline function, in the order they ran.
+    Hooks only see chunks processed in the current process. While no hook
+    is registered, nothing is timed.
+    """
+    _stage_hooks.append(hook)
+    return hook
+
+
+def remove_stage_hook(hook):
+    """
+    Unregister a hook added with `add_stage_hook`.
+    """
+    _stage_hooks.remove(hook)
+
+
+def _process_chunk_timed(chunk, steps):
+    # `steps` holds text-level functions and tuples of span stages, each
+    # tuple run as one `normalize_spans` pass.
+    timings = []
+    processed = chunk
+    for normalizer in steps:
+        if isinstance(normalizer, tuple):
+            processed = normalize_spans(processed, normalizer, timings)
+        else:
+            start = perf_counter()
+            try:
+                processed = normalizer(processed)
+            except Exception as error:
+                _tag_stage(error, _stage_name(normalizer))
+                raise
+            timings.append(StageTiming(_stage_name(normalizer), perf_counter() - start, None, None))
+    for hook in list(_stage_hooks):
+        hook(chunk, timings)
+    return processed
+
+
+class StageProfile:
+    """
+    Stage hook that aggregates what it is reported: per-stage totals of
+    calls, seconds, matches and replacements in `stages`, and one
+    `(length, seconds)` total per processed chunk in `chunks`.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.chunks = []
+
+    def __call__(self, chunk, timings):
+        for timing in timings:
+            totals = self.stages.get(timing.stage)
+            if totals is None:
+                totals = self.stages[timing.stage] = {'calls': 0, 'seconds': 0.0, 'matches': 0, 'replacements': 0}
+            totals['calls'] += 1
+            totals['seconds'] += timing.seconds
+            totals['matches'] += timing.matches or 0
+            totals['replacements'] += timing.replacements or 0
+        self.chunks.append((len(chunk), sum(timing.seconds for timing in timings)))
+
+    def report(self):
         """
-        Apply every function in `normalization_pipeline` to `chunk`
-        sequentially.
+        Return the per-stage totals, slowest stage first.
         """
-        processed = chunk
-        for normalizer in normalization_pipeline:
-            processed = normalizer(processed)
-        return processed
+        return sorted(self.stages.items(), key=lambda item: item[1]['seconds'], reverse=True)
+
+
+@contextmanager
+def profile_stages(hook=None):
+    """
+    Register `hook` (a new `StageProfile` by default) for the duration of
+    the `with` block and yield it.
+    """
+    if hook is None:
+        hook = StageProfile()
+    add_stage_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_stage_hook(hook)
+
 
-    if len(text) <= THRESHOLD:
+_sentence_cache = None
+
+
+def enable_sentence_cache(max_entries=4096, max_bytes=64 << 20):
+    """
+    Start caching normalized sentences (and short texts) in a fresh
+    `SentenceCache` bounded by `max_entries` and `max_bytes`, replacing any
+    cache already enabled. Returns the cache, whose `stats()` reports hits,
+    misses and evictions.
+    """
+    global _sentence_cache
+    _sentence_cache = SentenceCache(max_entries, max_bytes)
+    return _sentence_cache
+
+
+def disable_sentence_cache():
+    """
+    Stop caching and drop the current cache.
+    """
+    global _sentence_cache
+    _sentence_cache = None
+
+
+def get_sentence_cache():
+    """
+    Return the enabled `SentenceCache`, or None if caching is off.
+    """
+    return _sentence_cache
+
+
+_persistent_cache = None
+
+
+def enable_persistent_cache(path, max_bytes=1 << 30, version=None):
+    """
+    Start consulting the SQLite cache file at `path` (created if missing)
+    for every sentence and short text, after the in-memory sentence cache
+    if one is enabled. Keys hash the sentence, `version` (by default
+    `cache.library_version()`, a hash of the library's code and tables) and
+    the pipeline, so output of other code or another pipeline is never
+    served. Returns the `PersistentCache`.
+    """
+    global _persistent_cache
+    if _persistent_cache is not None:
+        _persistent_cache.close()
+    _persistent_cache = PersistentCache(path, max_bytes, version)
+    return _persistent_cache
+
+
+def disable_persistent_cache():
+    """
+    Stop consulting the persistent cache and close its file.
+    """
+    global _persistent_cache
+    if _persistent_cache is not None:
+        _persistent_cache.close()
+    _persistent_cache = None
+
+
+def get_persistent_cache():
+    """
+    Return the enabled `PersistentCache`, or None.
+    """
+    return _persistent_cache
+
+
+@lru_cache(maxsize=32)
+def _pipeline_fingerprint(pipeline):
+    return pipeline_fingerprint(pipeline)
+
+
+def _process_chunk_cached(chunk, pipeline=None):
+    """
+    `process_chunk` (or `pipeline.process_chunk`) through the sentence cache
+    and the persistent cache, when enabled. Keys include the functions in
+    `NORMALIZATION_PIPELINE` (or the stages of `pipeline`), so changing the
+    pipeline never serves output computed by a different one. Chunks that
+    raise are not cached.
+    """
+    cache, store = _sentence_cache, _persistent_cache
+    if pipeline is None:
+        process = process_chunk
+        if cache is None and store is None:
+            return process(chunk)
+        key = tuple(NORMALIZATION_PIPELINE)
+    else:
+        process = pipeline.process_chunk
+        if cache is None and store is None:
+            return process(chunk)
+        key = pipeline
+
+    if cache is not None:
+        processed = cache.get((key, chunk))
+        if processed is not None:
+            return processed
+    if store is not None:
+        config = _pipeline_fingerprint(key) if pipeline is None else pipeline.fingerprint
+        processed = store.get(chunk, config)
+        if processed is None:
+            processed = process(chunk)
+            store.put(chunk, config, processed)
+    else:
+        processed = process(chunk)
+    if cache is not None:
+        cache.put((key, chunk), processed)
+    return processed
+
+
+def normalize_sentence(sentence):
+    """
+    Normalize a single sentence of a longer text, leaving it unchanged (and
+    recording the failure) if it fails to normalise.
+    """
+    try:
+        return _process_chunk_cached(sentence)
+    except Exception as e:
+        _record_failure(sentence, e, 'normalize_sentence')
+        return sentence
+
+
+# Texts of at most this many characters are normalized as a whole by
+# `normalize_text`; longer ones are split into sentences and rejoined.
+SHORT_TEXT_LENGTH = 150
+
+
+def normalize_text(text):
+    """
+    Run the full normalisation pipeline on `text`.  For inputs longer than
+    `SHORT_TEXT_LENGTH`, the text is processed sentence-by-sentence; any segment that
+    fails to normalise is left unchanged, and the failure is recorded in the
+    error telemetry (see `telemetry.error_stats`).
+    """
+    if len(text) <= SHORT_TEXT_LENGTH:
         try:
-            return process_chunk(text)
+            return _process_chunk_cached(text)
         except Exception as e:
-            print(f'Error normalizing text: {e}\nReturning original text.')
+            _record_failure(text, e, 'normalize_text')
             return text
 
     sentences = split_into_sentences(text)
-    normalized_sentences = []
+    return join_sentences([normalize_sentence(sentence) for sentence in sentences])
+
+
+def iter_normalize(stream, chunk_size=1 << 16, max_buffer=1 << 20):
+    """
+    Normalize `stream` sentence by sentence, yielding each normalized
+    sentence as soon as it is complete.
+
+    `stream` is a file-like object, read `chunk_size` characters at a time,
+    or any iterable of strings such as an open file or a list of lines.
+    Only the text after the last `।`, `?` or `!` seen so far is buffered, so
+    memory does not grow with the input. Sentences are split exactly as
+    `split_into_sentences` splits them, and for inputs longer than
+    `normalize_text`'s threshold, joining the yielded sentences with spaces
+    gives `normalize_text` of the whole input. If the buffer grows past
+    `max_buffer` characters without a sentence end, it is cut at its last
+    whitespace.
+    """
+    for sentence in _iter_sentences(stream, chunk_size, max_buffer):
+        yield normalize_sentence(sentence)
+
+
+def _iter_sentences(stream, chunk_size, max_buffer):
+    """
+    Yield the sentences of `stream` as `iter_normalize` reads them.
+    """
+    if hasattr(stream, 'read'):
+        chunks = iter(lambda: stream.read(chunk_size), '')
+    else:
+        chunks = stream
+
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        end = max(buffer.rfind('।'), buffer.rfind('?'), buffer.rfind('!')) + 1
+        if not end and len(buffer) > max_buffer:
+            end = max(buffer.rfind(' '), buffer.rfind('\n')) + 1 or len(buffer)
+        if end:
+            yield from split_into_sentences(buffer[:end])
+            buffer = buffer[end:]
+
+    yield from split_into_sentences(buffer)
+
+
+def normalize_batch(texts, workers=None, chunksize=None, ordered=True):
+    """
+    Run `normalize_text` on every string in `texts`, spreading the work over
+    `workers` processes (one per CPU by default; 1 runs in this process).
+    Workers compile every pattern before taking their first chunk of
+    `chunksize` texts, and share the persistent cache if one is enabled.
+
+    Results are returned in input order and equal
+    `[normalize_text(t) for t in texts]`. With `ordered=False`, an iterator
+    of (index, normalized) pairs is returned instead, yielding each chunk as
+    soon as it finishes, so slow items never hold back the rest; the pool
+    is kept until the iterator is exhausted or closed. An item that raises is returned
+    unchanged instead of failing the batch. Failures recorded in worker
+    processes are added to this process's error telemetry.
+    """
+    return _map_batch(_normalize_item, texts, workers, chunksize, ordered)
+
+
+def _map_batch(normalize_item, texts, workers, chunksize, ordered):
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(texts)))
+    if chunksize is None:
+        chunksize = max(1, len(texts) // (workers * 4))
+
+    if workers == 1:
+        if not ordered:
+            return enumerate(map(normalize_item, texts))
+        return [normalize_item(text) for text in texts]
+    if not ordered:
+        return _map_unordered(normalize_item, texts, workers, chunksize)
+
+    with _worker_pool(workers, normalize_item) as pool:
+        return [_merge_errors(item) for item in pool.map(_normalize_in_worker, texts, chunksize)]
+
+
+def _map_unordered(normalize_item, texts, workers, chunksize):
+    with _worker_pool(workers, normalize_item) as pool:
+        for item in pool.imap_unordered(_normalize_indexed_in_worker, enumerate(texts), chunksize):
+            yield _merge_errors(item)
+
+
+def worker_setup(initializer=None, initargs=()):
+    """
+    Return (initializer, initargs) for a process pool, such as a
+    `multiprocessing.Pool` or a `ProcessPoolExecutor`, whose workers compile
+    every pattern and open the persistent cache enabled here before taking
+    work, then run `initializer(*initargs)` if one is given.
+    """
+    return _init_worker, _worker_initargs(None, initializer, initargs)
+
+
+def worker_pool(workers, initializer=None, initargs=()):
+    """
+    Return a `multiprocessing.Pool` of `workers` processes set up as
+    `worker_setup` describes.
+    """
+    return _worker_pool(workers, None, initializer, initargs)
+
+
+def _worker_pool(workers, normalize_item, initializer=None, initargs=()):
+    from multiprocessing import Pool
+
+    return Pool(workers, _init_worker, _worker_initargs(normalize_item, initializer, initargs))
+
 
-    for sentence in sentences:
+def _worker_initargs(normalize_item, initializer, initargs):
+    store_settings = _persistent_cache.settings() if _persistent_cache is not None else None
+    return store_settings, normalize_item, initializer, initargs
+
+
+def _merge_errors(item):
+    # A worker's (result, failures) pair: merge the failures, return the result.
+    result, errors = item
+    if errors is not None:
+        get_error_telemetry().merge(errors)
+    return result
+
+
+_worker_normalize_item = None
+
+
+def _init_worker(store_settings, normalize_item=None, initializer=None, initargs=()):
+    global _worker_normalize_item
+    warm_up()
+    if store_settings is not None and _persistent_cache is None:
+        enable_persistent_cache(*store_settings)
+    _worker_normalize_item = normalize_item
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _normalize_in_worker(text):
+    # Runs in a pool worker: the result, plus the failures recorded since
+    # the last item so the parent can merge them.
+    return _worker_normalize_item(text), get_error_telemetry().drain()
+
+
+def _normalize_indexed_in_worker(indexed_text):
+    index, text = indexed_text
+    return (index, _worker_normalize_item(text)), get_error_telemetry().drain()
+
+
+def _normalize_text_in_worker(text):
+    # `normalize_text` for process pools outside `normalize_batch`.
+    return normalize_text(text), get_error_telemetry().drain()
+
+
+def _normalize_item(text):
+    try:
+        return normalize_text(text)
+    except Exception as e:
+        _record_failure(text, e, 'normalize_batch')
+        return text
+
+
+# Text-level stages a `NormalizerPipeline` can run, by name.
+TEXT_STAGES = {
+    'english': translate_english_word,
+    'spaces': remove_extra_spaces,
+    'punctuation': remove_punctuation,
+}
+
+# Stages of a `NormalizerPipeline` built without a selection: the same work
+# as `normalize_text` with the default `NORMALIZATION_PIPELINE`.
+DEFAULT_STAGES = tuple(stage.name for stage in SPAN_STAGES) + ('english', 'spaces')
+
+_span_stages_by_name = {stage.name: stage for stage in SPAN_STAGES}
+
+
+class NormalizerPipeline:
+    """
+    `normalize_text` restricted to a chosen list of stages, run in the given
+    order.
+
+    `stages` names span stages (see `SPAN_STAGES`) and text stages (see
+    `TEXT_STAGES`); it defaults to `DEFAULT_STAGES`. Consecutive span stages
+    share one `normalize_spans` pass, where a stage listed earlier wins over
+    a later one it overlaps. Texts longer than `threshold` characters are
+    processed sentence by sentence. The stage list and the patterns it uses
+    are compiled when the pipeline is created. A pipeline pickles as its
+    stage names, so it is cheap to send to worker processes, and it shares
+    the sentence cache, persistent cache and stage hooks with
+    `normalize_text`.
+    """
+
+    def __init__(self, stages=None, threshold=SHORT_TEXT_LENGTH):
+        stages = DEFAULT_STAGES if stages is None else tuple(stages)
+        unknown = [name for name in stages if name not in _span_stages_by_name and name not in TEXT_STAGES]
+        if unknown:
+            raise ValueError(f"unknown stages: {', '.join(map(repr, unknown))}")
+        if len(set(stages)) != len(stages):
+            raise ValueError("each stage may only be listed once")
+        self.stages = stages
+        self.threshold = threshold
+        self.fingerprint = f"NormalizerPipeline({','.join(stages)})"
+        self._steps = self._compile()
+
+    def _compile(self):
+        steps = []
+        patterns = ['sentences', 'any_digit']
+        for name in self.stages:
+            stage = _span_stages_by_name.get(name)
+            if stage is None:
+                steps.append(TEXT_STAGES[name])
+                continue
+            if steps and isinstance(steps[-1], tuple):
+                steps[-1] += (stage,)
+            else:
+                steps.append((stage,))
+            patterns.extend(stage.patterns)
+        if 'english' in self.stages:
+            patterns.append('latin_letter')
+        for name in patterns:
+            get_pattern(name)
+        return tuple(steps)
+
+    def __reduce__(self):
+        return self.__class__, (self.stages, self.threshold)
+
+    def __eq__(self, other):
+        if not isinstance(other, NormalizerPipeline):
+            return NotImplemented
+        return (self.stages, self.threshold) == (other.stages, other.threshold)
+
+    def __hash__(self):
+        return hash((self.stages, self.threshold))
+
+    def __repr__(self):
+        return f"NormalizerPipeline(stages={self.stages!r}, threshold={self.threshold!r})"
+
+    def process_chunk(self, chunk):
+        """
+        Run every stage on `chunk`, uncached and without splitting it.
+        """
+        if _stage_hooks:
+            return _process_chunk_timed(chunk, self._steps)
+        for step in self._steps:
+            if isinstance(step, tuple):
+                chunk = normalize_spans(chunk, step)
+            else:
+                try:
+                    chunk = step(chunk)
+                except Exception as error:
+                    _tag_stage(error, _stage_name(step))
+                    raise
+        return chunk
+
+    def normalize_sentence(self, sentence):
+        """
+        Normalize one sentence, leaving it unchanged (and recording the
+        failure) if it fails to normalise.
+        """
         try:
-            normalized_sentence = process_chunk(sentence)
+            return _process_chunk_cached(sentence, self)
         except Exception as e:
-            print(
-                f"Error processing sentence: '{sentence}'\nError: {e}\nLeaving sentence as-is."
-            )
-            normalized_sentence = sentence
-        normalized_sentences.append(normalized_sentence)
+            _record_failure(sentence, e, 'normalize_sentence')
+            return sentence
 
-    return join_sentences(normalized_sentences)
+    def __call__(self, text):
+        """
+        Normalize `text` the way `normalize_text` does, with this pipeline's
+        stages.
+        """
+        if len(text) <= self.threshold:
+            try:
+                return _process_chunk_cached(text, self)
+            except Exception as e:
+                _record_failure(text, e, 'normalize_text')
+                return text
+        return join_sentences([self.normalize_sentence(sentence) for sentence in split_into_sentences(text)])
+
+    def normalize_batch(self, texts, workers=None, chunksize=None, ordered=True):
+        """
+        `normalize_batch` with this pipeline; only the stage names are sent
+        to the worker processes.
+        """
+        return _map_batch(self._normalize_item, texts, workers, chunksize, ordered)
+
+    def iter_normalize(self, stream, chunk_size=1 << 16, max_buffer=1 << 20):
+        """
+        `iter_normalize` with this pipeline.
+        """
+        for sentence in _iter_sentences(stream, chunk_size, max_buffer):
+            yield self.normalize_sentence(sentence)
+
+    def _normalize_item(self, text):
+        try:
+            return self(text)
+        except Exception as e:
+            _record_failure(text, e, 'normalize_batch')
+            return text
 
 
 def bangla_to_ipa_converter(sentence):
@@ -200,21 +877,106 @@ def bangla_to_ipa_converter(sentence):
     """
     sentence = remove_punctuation(sentence)
     sentence = normalize_text(sentence)
-    ipa_output = ""
-    i = 0
-    max_conj_length = max(len(key) for key in bangla_conjuncts_to_ipa) if bangla_conjuncts_to_ipa else 0
-    while i < len(sentence):
-        match_found = False
-        for l in range(max_conj_length, 0, -1):
-            if i + l <= len(sentence):
-                segment = sentence[i:i + l]
-                if segment in bangla_conjuncts_to_ipa:
-                    ipa_output += bangla_conjuncts_to_ipa[segment]
-                    i += l
-                    match_found = True
-                    break
-        if not match_found:
-            char = sentence[i]
-            ipa_output += bangla_to_ipa.get(char, char)
-            i += 1
-    return ipa_output
\ No newline at end of file
+    return _graphemes_to_ipa(sentence)
+
+
+Phonemized = namedtuple('Phonemized', 'text ipa')
+
+
+def normalized_to_ipa(text):
+    """
+    Convert text that has already been through `normalize_text` to IPA,
+    without normalizing it again: punctuation is removed and the rest is
+    converted grapheme by grapheme.
+    """
+    return _graphemes_to_ipa(remove_punctuation(text))
+
+
+def normalize_and_phonemize(text):
+    """
+    Normalize `text` and convert the result to IPA in one pass, returning
+    `Phonemized(text, ipa)` where `text` equals `normalize_text(text)` and
+    `ipa` is `normalized_to_ipa` of it.
+
+    Unlike `bangla_to_ipa_converter`, punctuation is removed after
+    normalization, so the IPA follows how dates, times and decimals are
+    read in the normalized text.
+    """
+    normalized = normalize_text(text)
+    return Phonemized(normalized, normalized_to_ipa(normalized))
+
+
+def _graphemes_to_ipa(text):
+    """
+    Convert `text` to IPA word by word through the IPA memo, if enabled.
+    No conjunct contains a space and ' ' maps to itself, so this equals
+    `_walk_graphemes_to_ipa` of the whole text.
+    """
+    memo = _ipa_memo
+    if memo is None:
+        return _walk_graphemes_to_ipa(text)
+    return ' '.join(memo.convert(text.split(' ')))
+
+
+def _walk_graphemes_to_ipa(text):
+    """
+    At every position, replace the longest key of `bangla_conjuncts_to_ipa`
+    that starts there; map every other character through `bangla_to_ipa`.
+    """
+    conjunct_pattern, char_table, conjuncts = _ipa_engine()
+    if conjunct_pattern is None:
+        return text.translate(char_table)
+
+    pieces = []
+    position = 0
+    for match in conjunct_pattern.finditer(text):
+        pieces.append(text[position:match.start()].translate(char_table))
+        pieces.append(conjuncts[match.group()])
+        position = match.end()
+    pieces.append(text[position:].translate(char_table))
+    return ''.join(pieces)
+
+
+@lru_cache(maxsize=None)
+def _ipa_engine():
+    """
+    Compile, on first use, the regex that matches the longest conjunct at
+    any position, and fetch the `str.translate` table for single characters
+    (see `snapshot._build_ipa_conjunct_regex`).
+    """
+    conjunct_regex = get_table('ipa_conjunct_regex')
+    conjunct_pattern = re.compile(conjunct_regex) if conjunct_regex else None
+    return conjunct_pattern, get_table('ipa_char_table'), get_table('ipa_conjuncts')
+
+
+_ipa_memo = WordMemo(_walk_graphemes_to_ipa)
+
+
+def enable_ipa_memo(max_entries=1 << 16, lexicon=None):
+    """
+    Replace the IPA memo with a fresh `WordMemo` of at most `max_entries`
+    words, preloaded from the lexicon file at `lexicon` if given (see
+    `WordMemo.preload_file`). The memo is on by default. Returns it; its
+    `stats()` reports hits, misses and evictions.
+    """
+    global _ipa_memo
+    memo = WordMemo(_walk_graphemes_to_ipa, max_entries)
+    if lexicon is not None:
+        memo.preload_file(lexicon)
+    _ipa_memo = memo
+    return memo
+
+
+def disable_ipa_memo():
+    """
+    Convert every word to IPA character by character again.
+    """
+    global _ipa_memo
+    _ipa_memo = None
+
+
+def get_ipa_memo():
+    """
+    Return the IPA memo, or None if it is disabled.
+    """
+    return _ipa_memo
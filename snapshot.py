@@ -0,0 +1,245 @@
+import hashlib
+import marshal
+import os
+import re
+import string
+import sys
+from functools import lru_cache
+
+# Lookup indexes derived from the tables in conversion_data.py and
+# ipa_data.py. `python -m bangla_normalizer.snapshot build` stores them all
+# in one marshal file, so a process (or pool worker) reads them in a single
+# load instead of deriving them again. The snapshot is only used while it
+# matches the source files; otherwise each index is built from the source
+# the first time it is asked for.
+
+SNAPSHOT_FORMAT = 1
+SOURCE_FILES = ('conversion_data.py', 'ipa_data.py', 'snapshot.py')
+
+_package_dir = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SNAPSHOT_PATH = os.environ.get(
+    'BANGLA_NORMALIZER_SNAPSHOT', os.path.join(_package_dir, 'tables.snapshot')
+)
+
+
+def _build_below_thousand_words():
+    from .conversion_data import englishNum, hundred_suffix
+    return [englishNum[n] for n in range(100)] + [
+        englishNum[n // 100] + hundred_suffix + (" " + englishNum[n % 100] if n % 100 else "")
+        for n in range(100, 1000)
+    ]
+
+
+def _build_bangla_month_names():
+    from .conversion_data import bangla_months
+    return list(bangla_months)
+
+
+def _build_month_numbers():
+    # Month name (Bengali, English full, English short) -> month number.
+    from .conversion_data import bangla_months
+    month_numbers = {
+        name: number
+        for number, (bangla_month, english_month) in enumerate(bangla_months.items(), start=1)
+        for name in (bangla_month, english_month.lower(), english_month[:3].lower())
+    }
+    month_numbers['sept'] = 9
+    return month_numbers
+
+
+def _build_units_by_length():
+    from .conversion_data import unit_to_bangla_map
+    return sorted(unit_to_bangla_map.items(), key=lambda x: len(x[0]), reverse=True)
+
+
+def _build_punctuation_table():
+    bengali_punctuation = "।‘’“”"
+    return str.maketrans('', '', string.punctuation + bengali_punctuation + "-")
+
+
+def _build_ipa_conjuncts():
+    from .ipa_data import bangla_conjuncts_to_ipa
+    return dict(bangla_conjuncts_to_ipa)
+
+
+def _build_ipa_char_table():
+    from .ipa_data import bangla_to_ipa
+    return str.maketrans({char: ipa for char, ipa in bangla_to_ipa.items() if len(char) == 1})
+
+
+def _build_ipa_conjunct_regex():
+    """
+    Source of a regex that matches the longest conjunct at any position, or
+    '' if there are no conjuncts.
+
+    The regex is laid out as a trie over the conjunct keys, so each position
+    costs one branch per character instead of one try per key. Trying longer
+    paths before stopping at a shorter key makes the first match the longest.
+    """
+    from .ipa_data import bangla_conjuncts_to_ipa
+
+    trie = {}
+    for key in bangla_conjuncts_to_ipa:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def to_regex(node):
+        branches = [re.escape(char) + to_regex(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return to_regex(trie)
+
+
+# Index name -> function that derives it from the source tables.
+TABLE_BUILDERS = {
+    'below_thousand_words': _build_below_thousand_words,
+    'bangla_month_names': _build_bangla_month_names,
+    'month_numbers': _build_month_numbers,
+    'units_by_length': _build_units_by_length,
+    'punctuation_table': _build_punctuation_table,
+    'ipa_conjuncts': _build_ipa_conjuncts,
+    'ipa_char_table': _build_ipa_char_table,
+    'ipa_conjunct_regex': _build_ipa_conjunct_regex,
+}
+
+_tables = {}
+_snapshot = None
+
+
+def source_fingerprint():
+    """
+    Hash of the snapshot format, the marshal version and the source files
+    the indexes are derived from.
+    """
+    digest = hashlib.sha256(f"{SNAPSHOT_FORMAT}:{marshal.version}".encode())
+    for name in SOURCE_FILES:
+        with open(os.path.join(_package_dir, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Modules whose code decides what normalization and IPA conversion return,
+# besides the `SOURCE_FILES`. Tools around them (cli, corpus, jobs, ...)
+# are left out so that changing them keeps caches and checkpoints valid.
+OUTPUT_MODULES = ('normalizer.py', 'methods.py', 'utils.py', 'extractor.py')
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint():
+    """
+    Hash of `source_fingerprint` and the `OUTPUT_MODULES`, so that it
+    changes whenever the code or the tables that produce the output change.
+    Read once per process.
+    """
+    digest = hashlib.sha256(source_fingerprint().encode())
+    for name in OUTPUT_MODULES:
+        digest.update(name.encode() + b'\0')
+        with open(os.path.join(_package_dir, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def build_tables():
+    """
+    Derive every index in `TABLE_BUILDERS` from the source tables.
+    """
+    return {name: builder() for name, builder in TABLE_BUILDERS.items()}
+
+
+def write_snapshot(path=DEFAULT_SNAPSHOT_PATH):
+    """
+    Build every index and write them, with the source fingerprint, to
+    `path`. The file is replaced atomically.
+    """
+    data = marshal.dumps({
+        'format': SNAPSHOT_FORMAT,
+        'fingerprint': source_fingerprint(),
+        'tables': build_tables(),
+    })
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(data)
+    os.replace(temporary_path, path)
+    return len(data)
+
+
+def load_snapshot(path=DEFAULT_SNAPSHOT_PATH):
+    """
+    Return the indexes stored at `path`, or None if there is no snapshot
+    or it was built from different source files.
+    """
+    try:
+        with open(path, 'rb') as f:
+            snapshot = marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('format') != SNAPSHOT_FORMAT:
+        return None
+    if snapshot.get('fingerprint') != source_fingerprint():
+        return None
+    return snapshot['tables']
+
+
+def get_table(name):
+    """
+    Return the derived index `name`: from the snapshot when a current one
+    exists, otherwise built from the source tables on first use.
+    """
+    global _snapshot
+    try:
+        return _tables[name]
+    except KeyError:
+        pass
+    if _snapshot is None:
+        _snapshot = load_snapshot() or {}
+    table = _snapshot.get(name)
+    if table is None:
+        table = TABLE_BUILDERS[name]()
+    _tables[name] = table
+    return table
+
+
+def check_snapshot(path=DEFAULT_SNAPSHOT_PATH):
+    """
+    Return a list of problems with the snapshot at `path`: missing, stale,
+    or holding an index that differs from one built from the source.
+    An empty list means the snapshot is current.
+    """
+    tables = load_snapshot(path)
+    if tables is None:
+        return [f"{path} is missing, unreadable or built from other sources"]
+    return [
+        f"{name} differs from the source tables"
+        for name, table in build_tables().items()
+        if tables.get(name) != table
+    ]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or check the snapshot of derived lookup tables.")
+    parser.add_argument('command', choices=['build', 'check'])
+    parser.add_argument('path', nargs='?', default=DEFAULT_SNAPSHOT_PATH,
+                        help=f"snapshot file (default: {DEFAULT_SNAPSHOT_PATH})")
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        size = write_snapshot(args.path)
+        print(f"Wrote {len(TABLE_BUILDERS)} tables ({size} bytes) to {args.path}")
+        return
+    problems = check_snapshot(args.path)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if problems:
+        sys.exit(1)
+    print(f"{args.path} is up to date")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+import threading
+
+
+class ErrorTelemetry:
+    """
+    Thread-safe record of normalization failures, keyed by the span stage or
+    function that failed.
+
+    For every stage it keeps the number of failures, a count per error type
+    and a random sample of at most `sample_size` failing inputs (each cut to
+    `sample_chars` characters) with their error messages. Recording is a
+    dictionary update, so failures cost no I/O unless a logger is attached
+    with `enable_error_logging`.
+    """
+
+    def __init__(self, sample_size=20, sample_chars=200):
+        if sample_size < 0:
+            raise ValueError("sample_size must not be negative")
+        self.sample_size = sample_size
+        self.sample_chars = sample_chars
+        self.logger = None
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, value, error=None, message=None):
+        """
+        Count one failure of `stage` on input `value`, caused by the
+        exception `error` or described by `message`.
+        """
+        kind = type(error).__name__ if error is not None else 'warning'
+        if message is None:
+            message = f"{kind}: {error}"
+        sample = (str(value)[:self.sample_chars], message)
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = {'count': 0, 'errors': {}, 'samples': []}
+            entry['count'] += 1
+            entry['errors'][kind] = entry['errors'].get(kind, 0) + 1
+            samples = entry['samples']
+            if len(samples) < self.sample_size:
+                samples.append(sample)
+            elif self.sample_size:
+                from random import randrange
+
+                # Reservoir sampling: every failure is kept with equal chance.
+                index = randrange(entry['count'])
+                if index < self.sample_size:
+                    samples[index] = sample
+        logger = self.logger
+        if logger is not None:
+            logger.warning("%s failed on %r: %s", stage, sample[0], message)
+
+    def stats(self):
+        """
+        Return a copy of the record: stage -> {'count', 'errors', 'samples'},
+        where `errors` maps error type names (or 'warning') to counts and
+        `samples` lists (input, message) pairs.
+        """
+        with self._lock:
+            return {
+                stage: {'count': entry['count'], 'errors': dict(entry['errors']), 'samples': list(entry['samples'])}
+                for stage, entry in self._stages.items()
+            }
+
+    def total(self):
+        """
+        Return the number of failures recorded across all stages.
+        """
+        with self._lock:
+            return sum(entry['count'] for entry in self._stages.values())
+
+    def drain(self):
+        """
+        Return the record and start a new, empty one, or return None if
+        nothing was recorded. Used to ship a worker's failures to the parent.
+        """
+        with self._lock:
+            if not self._stages:
+                return None
+            stages, self._stages = self._stages, {}
+            return stages
+
+    def merge(self, stats):
+        """
+        Add a record returned by `stats` or `drain` (e.g. from a worker
+        process) to this one.
+        """
+        with self._lock:
+            for stage, other in stats.items():
+                entry = self._stages.get(stage)
+                if entry is None:
+                    entry = self._stages[stage] = {'count': 0, 'errors': {}, 'samples': []}
+                entry['count'] += other['count']
+                for kind, count in other['errors'].items():
+                    entry['errors'][kind] = entry['errors'].get(kind, 0) + count
+                room = self.sample_size - len(entry['samples'])
+                if room > 0:
+                    entry['samples'].extend(other['samples'][:room])
+
+    def reset(self):
+        """
+        Forget every recorded failure.
+        """
+        with self._lock:
+            self._stages = {}
+
+
+_telemetry = ErrorTelemetry()
+
+
+def get_error_telemetry():
+    """
+    Return the `ErrorTelemetry` that every normalizer in this process
+    records its failures to.
+    """
+    return _telemetry
+
+
+def record_error(stage, value, error=None, message=None):
+    """
+    Record a failure of `stage` on `value`; see `ErrorTelemetry.record`.
+    """
+    _telemetry.record(stage, value, error, message)
+
+
+def error_stats():
+    """
+    Return the failures recorded so far, per stage; see `ErrorTelemetry.stats`.
+    """
+    return _telemetry.stats()
+
+
+def reset_error_stats():
+    """
+    Forget every failure recorded so far.
+    """
+    _telemetry.reset()
+
+
+def enable_error_logging(logger=None):
+    """
+    Also log every failure as a warning on `logger` (a `logging.Logger`, or
+    the name of one; the 'bangla_normalizer' logger by default). Returns
+    the logger.
+    """
+    import logging
+
+    if logger is None or isinstance(logger, str):
+        logger = logging.getLogger(logger or 'bangla_normalizer')
+    _telemetry.logger = logger
+    return logger
+
+
+def disable_error_logging():
+    """
+    Stop logging failures. They are still counted and sampled.
+    """
+    _telemetry.logger = None
@@ -0,0 +1,13 @@
+import os
+import sys
+import types
+
+# The repository root is the `bangla_normalizer` package itself. Make it
+# importable under that name when the tests run from a checkout.
+if 'bangla_normalizer' not in sys.modules:
+    try:
+        import bangla_normalizer  # noqa: F401
+    except ImportError:
+        package = types.ModuleType('bangla_normalizer')
+        package.__path__ = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+        sys.modules['bangla_normalizer'] = package
@@ -0,0 +1,86 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from bangla_normalizer.normalizer import normalize_text
+from bangla_normalizer.telemetry import error_stats, reset_error_stats
+from bangla_normalizer.arrow_io import (
+    normalize_array, normalize_table, normalize_parquet, normalize_parquet_row_groups,
+)
+
+TEXTS = ["আজ ১২ তারিখ", None, "বাংলা", "৫০% ছাড়", "রাত ১০:৩০ টায়", "facebook ২০২১ সালে", "বাংলা", None, "দাম ৳৫০০"]
+EXPECTED = [None if text is None else normalize_text(text) for text in TEXTS]
+
+
+def _write(path, row_group_size=2):
+    pq.write_table(pa.table({"id": list(range(len(TEXTS))), "text": TEXTS}), path, row_group_size=row_group_size)
+
+
+@pytest.mark.parametrize("type_", [pa.string(), pa.large_string()])
+def test_array_keeps_type_and_nulls(type_):
+    result = normalize_array(pa.array(TEXTS, type=type_))
+    assert result.type == type_
+    assert result.to_pylist() == EXPECTED
+
+
+def test_dictionary_array():
+    result = normalize_array(pa.array(TEXTS).dictionary_encode())
+    assert pa.types.is_dictionary(result.type)
+    assert result.to_pylist() == EXPECTED
+
+
+def test_non_string_column_is_rejected():
+    with pytest.raises(TypeError):
+        normalize_array(pa.array([1, 2]))
+
+
+def test_table_in_small_batches():
+    table = pa.table({"id": list(range(len(TEXTS))), "text": TEXTS})
+    result = normalize_table(table, "text", output_column="normalized", batch_size=2)
+    assert result.column_names == ["id", "text", "normalized"]
+    assert result.column("text").to_pylist() == TEXTS
+    assert result.column("normalized").to_pylist() == EXPECTED
+
+
+def test_parquet_file(tmp_path):
+    _write(tmp_path / "in.parquet")
+    rows = normalize_parquet(str(tmp_path / "in.parquet"), str(tmp_path / "out.parquet"), "text", batch_size=3)
+    assert rows == len(TEXTS)
+    assert pq.read_table(tmp_path / "out.parquet").column("text").to_pylist() == EXPECTED
+    assert not (tmp_path / "out.parquet.tmp").exists()
+
+
+def test_parquet_row_group_selection(tmp_path):
+    _write(tmp_path / "in.parquet")
+    rows = normalize_parquet(str(tmp_path / "in.parquet"), str(tmp_path / "out.parquet"), "text", row_groups=[1, 2])
+    assert rows == 4
+    assert pq.read_table(tmp_path / "out.parquet").column("text").to_pylist() == EXPECTED[2:6]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_row_groups_without_failures(tmp_path, workers):
+    _write(tmp_path / "in.parquet")
+    reset_error_stats()
+
+    paths = normalize_parquet_row_groups(str(tmp_path / "in.parquet"), str(tmp_path / "out"), "text",
+                                         output_column="normalized", workers=workers)
+
+    assert len(paths) == 5
+    table = pa.concat_tables([pq.read_table(path) for path in paths])
+    assert table.column("text").to_pylist() == TEXTS
+    assert table.column("normalized").to_pylist() == EXPECTED
+    assert error_stats() == {}
+
+
+def test_row_groups_resume_keeps_finished_parts(tmp_path):
+    _write(tmp_path / "in.parquet")
+    output_dir = tmp_path / "out"
+    paths = normalize_parquet_row_groups(str(tmp_path / "in.parquet"), str(output_dir), "text")
+    finished = pq.read_table(paths[0]).replace_schema_metadata({"kept": "yes"})
+    pq.write_table(finished, paths[0])
+    (output_dir / "part-00001.parquet").unlink()
+
+    normalize_parquet_row_groups(str(tmp_path / "in.parquet"), str(output_dir), "text")
+
+    assert pq.read_schema(paths[0]).metadata == {b"kept": b"yes"}
+    assert pq.read_table(paths[1]).column("text").to_pylist() == EXPECTED[2:4]
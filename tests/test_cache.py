@@ -0,0 +1,51 @@
+import threading
+
+from bangla_normalizer.cache import WordMemo
+
+
+def test_convert_counts_and_evicts():
+    calls = []
+
+    def compute(word):
+        calls.append(word)
+        return word.upper()
+
+    memo = WordMemo(compute, max_entries=2, max_word_length=3)
+    assert memo.convert(["ab", "cd", "ab", "long"]) == ["AB", "CD", "AB", "LONG"]
+    assert calls == ["ab", "cd", "long"]
+    assert memo.convert(["ef", "ab"]) == ["EF", "AB"]
+    stats = memo.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions'], stats['entries']) == (2, 4, 1, 2)
+    # "ab" was used last, so "cd" was evicted.
+    memo.convert(["ab", "cd"])
+    assert calls == ["ab", "cd", "long", "ef", "cd"]
+
+
+def test_preload_pins_words():
+    memo = WordMemo(str.upper, max_entries=1)
+    memo.convert(["ab"])
+    assert memo.preload(["ab", "cd", "", "cd"]) == 2
+    memo.convert(["ef", "gh"])
+    assert memo.convert(["ab", "cd"]) == ["AB", "CD"]
+    assert memo.stats()['lexicon_hits'] == 2
+
+
+def test_misses_are_computed_outside_the_lock():
+    # Each word's computation waits for the other's to start, which can
+    # only happen if two threads compute at the same time.
+    started = {"a": threading.Event(), "b": threading.Event()}
+
+    def compute(word):
+        started[word].set()
+        assert started["b" if word == "a" else "a"].wait(5)
+        return word.upper()
+
+    memo = WordMemo(compute)
+    results = {}
+    threads = [threading.Thread(target=lambda word=word: results.update({word: memo.convert([word])}))
+               for word in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"a": ["A"], "b": ["B"]}
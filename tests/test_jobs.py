@@ -0,0 +1,97 @@
+import os
+import threading
+
+import pytest
+
+from bangla_normalizer import jobs
+from bangla_normalizer.jobs import (
+    create_job, claim_shard, process_job_shard, run_node, job_status, merge_job,
+)
+from bangla_normalizer.normalizer import normalize_text
+
+LINES = ["আজ ১২ তারিখ", "দাম ৳৫০০ টাকা", "৫০% ছাড়", "রাত ১০:৩০ টায়", "বাংলা"]
+
+
+@pytest.fixture
+def job(tmp_path):
+    inputs = []
+    for n in range(2):
+        path = tmp_path / f"in{n}.txt"
+        # The second file has no trailing newline.
+        path.write_text("\n".join(LINES * 20) + ("\n" if n == 0 else ""), encoding="utf-8")
+        inputs.append(str(path))
+    job_dir = str(tmp_path / "job")
+    create_job(job_dir, inputs, num_shards=4, piece_bytes=256)
+    return job_dir
+
+
+def _expire(job_dir, shard, attempt, age=3600):
+    path = os.path.join(job_dir, 'claims', f"shard-{shard:05d}.{attempt}")
+    old = os.path.getmtime(path) - age
+    os.utime(path, (old, old))
+
+
+def test_live_claim_blocks_a_second_node(job):
+    assert claim_shard(job, 0, "a") == 1
+    assert claim_shard(job, 0, "b") is None
+    assert job_status(job)['running'] == 1
+
+
+def test_simultaneous_claims_have_one_winner(job):
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def claim(node):
+        barrier.wait()
+        results[node] = claim_shard(job, 1, node)
+
+    threads = [threading.Thread(target=claim, args=(node,)) for node in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results.values(), key=str) == [1, None]
+
+
+def test_claim_lost_at_create_time(job, monkeypatch):
+    assert claim_shard(job, 3, "a") == 1
+    # Node b listed the claims before node a created its file, so it tries
+    # the same attempt; O_EXCL makes its create fail.
+    monkeypatch.setattr(jobs, '_attempts', lambda job_dir, shard: [])
+    assert claim_shard(job, 3, "b") is None
+    assert sorted(os.listdir(os.path.join(job, 'claims'))) == ["shard-00003.1"]
+
+
+def test_expired_lease_is_taken_over(job):
+    assert claim_shard(job, 2, "a") == 1
+    _expire(job, 2, 1)
+    assert job_status(job)['expired'] == 1
+
+    assert claim_shard(job, 2, "b") == 2
+    assert claim_shard(job, 2, "a") is None
+    process_job_shard(job, 2, 2)
+    assert claim_shard(job, 2, "c") is None
+    assert job_status(job)['done'] == 1
+
+
+def test_two_nodes_then_merge(job, tmp_path):
+    processed = run_node(job, "a", max_shards=2) + run_node(job, "b")
+    assert sorted(processed) == [0, 1, 2, 3]
+
+    output = tmp_path / "out.txt"
+    assert merge_job(job, str(output)) == 2 * 20 * len(LINES)
+    expected = [normalize_text(line) for line in LINES] * 40
+    assert output.read_text(encoding="utf-8").splitlines() == expected
+
+
+def test_merge_rejects_a_changed_output(job, tmp_path):
+    run_node(job, "a")
+    outputs = os.path.join(job, 'outputs')
+    name = sorted(os.listdir(outputs))[0]
+    with open(os.path.join(outputs, name), 'a', encoding='utf-8') as f:
+        f.write("extra\n")
+
+    output = tmp_path / "out.txt"
+    with pytest.raises(ValueError, match="checksum"):
+        merge_job(job, str(output))
+    assert not output.exists()
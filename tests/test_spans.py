@@ -0,0 +1,79 @@
+import re
+
+import pytest
+
+from bangla_normalizer.methods import date_to_word
+from bangla_normalizer.normalizer import SpanStage, normalize_spans, normalize_text
+from bangla_normalizer.telemetry import error_stats, reset_error_stats
+
+
+def _finder(pattern):
+    return lambda text: ((match.start(), match.end()) for match in re.finditer(pattern, text))
+
+
+def _fixed(*spans):
+    return lambda text: iter(spans)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("দাম ৳৫০০ টাকা, ছাড় ২০%", "দাম পাঁচশো টাকা, ছাড় বিশ পার্সেন্ট"),
+    ("৩৫.৫°C", "পঁয়ত্রিশ দশমিক পাঁচ ডিগ্রি সেলসিয়াস"),
+    ("১৫-০১-২০২৫", "পনেরোই জানুয়ারি দুই হাজার পঁচিশ"),
+    ("১২ এবং ১২৩", "বারো এবং একশো তেইশ"),
+])
+def test_known_outputs(text, expected):
+    assert normalize_spans(text) == expected
+
+
+def test_numbers_inside_longer_spans_are_masked():
+    # The phone number's digits are never read as one big number, and the
+    # year after "সালে" does not rewrite the same digits inside the date.
+    assert normalize_text("ফোন ০১৭১২৩৪৫৬৭৮") == "ফোন শূন্য এক সাত এক দুই তিন চার পাঁচ ছয় সাত আট"
+    assert normalize_spans("১৯৬২ সালে ও 6 ডিসেম্বর, ১৯৬২") == \
+        "উনিশশো বাষট্টি সালে ও ছয় ডিসেম্বর, এক হাজার নয়শো বাষট্টি"
+
+
+def test_each_time_gets_its_own_period_word():
+    assert normalize_spans("৩:১৮ ও ১০:৩৮ টায়") == "ভোর তিন টা আঠারো মিনিটে ও সকাল দশ টা আটত্রিশ মিনিটে"
+
+
+def test_later_masks_see_earlier_replacements():
+    stages = (
+        SpanStage('first', _finder('ab'), lambda match: 'X'),
+        SpanStage('second', _finder('bc'), lambda match: 'Y'),
+    )
+    assert normalize_spans("abc", stages) == "Xc"
+
+
+def test_overlapping_matches_are_rejected():
+    stages = (
+        SpanStage('first', _fixed((0, 2), (1, 3), (4, 5)), str.upper),
+        SpanStage('second', _fixed((3, 5), (5, 6)), lambda match: '_'),
+    )
+    # (1, 3) overlaps a span of its own stage and (3, 5) one of an earlier
+    # stage; both are dropped, and the spans around them are kept.
+    assert normalize_spans("abcdef", stages) == "ABcdE_"
+
+
+def test_stage_without_triggers_is_skipped():
+    def explode(text):
+        raise AssertionError("finder ran without its trigger")
+
+    stages = (SpanStage('percent', explode, str, triggers=(('%',),)),)
+    assert normalize_spans("আজ বৃষ্টি হয়েছে", stages) == "আজ বৃষ্টি হয়েছে"
+    with pytest.raises(AssertionError):
+        normalize_spans("২০%", stages)
+
+
+def test_digit_trigger_needs_a_digit():
+    timings = []
+    assert normalize_spans("আজ বৃষ্টি হয়েছে", timings=timings) == "আজ বৃষ্টি হয়েছে"
+    assert [timing.matches for timing in timings] == [0] * len(timings)
+
+
+def test_invalid_date_stays_unchanged():
+    reset_error_stats()
+    assert date_to_word("৩১-০২-২০২৫") == "৩১-০২-২০২৫"
+    assert normalize_text("৩১-০২-২০২৫ তারিখে") == "৩১-০২-২০২৫ তারিখে"
+    assert error_stats()
+    reset_error_stats()
@@ -1,7 +1,8 @@
 from .conversion_data import *
-from dateutil.parser import parse
-import re, string
-from datetime import datetime
+from .extractor import get_pattern
+from .snapshot import get_table
+from .telemetry import record_error
+from datetime import date
 
 
 bangla_to_english_digits = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
@@ -14,7 +15,8 @@ def separate_year(year_str):
     into a tuple consisting of:
         • num1 → the century part (e.g., 1900)
         • num2 → the year part   (e.g.,   23)
-    Returns (num1, num2).  If conversion fails, returns (None, None).
+    Returns (num1, num2).  If conversion fails, records the failure and
+    returns (None, None).
     """
     english_year_str = str(year_str).translate(bangla_to_english_digits)
     try:
@@ -22,42 +24,66 @@ def separate_year(year_str):
         num1 = (english_year_int // 100) * 100
         num2 = english_year_int % 100
         return num1, num2
-    except ValueError:
-        print(f"Warning: Could not parse year '{year_str}' as integer.")
+    except ValueError as e:
+        record_error('separate_year', year_str, e)
         return None, None
 
 
+bangla_month_names = get_table('bangla_month_names')
+
+# Month name (Bengali, English full, English short) -> month number.
+month_numbers = get_table('month_numbers')
+
+
 def extract_date_components_bangla(bangla_date):
     """
-    Parse a Bangla date string, convert any Bengali digits/month names to
-    English, and return the components:
+    Parse a Bangla or English date string and return the components:
         • day   → Bangla digits
         • month → Bangla month name
         • year  → Bangla digits
-    On failure, returns a descriptive error string.
+    Accepts the layouts the date extractor matches: day-first numeric
+    (DD/MM/YYYY), year-first numeric (YYYY-MM-DD) and day-month name-year
+    (with optional ordinal suffix, comma or separators), in Bengali or
+    English digits. Numeric layouts swap day and month when the month
+    field is above 12.
+    Returns None, and records the failure, if the string is not a valid
+    date in one of these layouts.
     """
-    bangla_to_english_digits = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
-    english_to_bangla_digits = str.maketrans("0123456789", "০১২৩৪৫৬৭৮৯")
-
     try:
-        for bangla_month, english_month in bangla_months.items():
-            bangla_date = bangla_date.replace(bangla_month, english_month)
-
-        bangla_date = bangla_date.translate(bangla_to_english_digits)
-        parsed_date = parse(bangla_date, dayfirst=True, fuzzy=True)
-        day = str(parsed_date.day).translate(english_to_bangla_digits)
-        month = list(bangla_months.keys())[list(bangla_months.values()).index(parsed_date.strftime("%B"))]
-        year = str(parsed_date.year).translate(english_to_bangla_digits)
+        match = get_pattern('date_day_first').fullmatch(bangla_date)
+        if match:
+            day, month, year = int(match.group(1)), int(match.group(3)), int(match.group(4))
+        else:
+            match = get_pattern('date_year_first').fullmatch(bangla_date)
+            if match:
+                year, month, day = int(match.group(1)), int(match.group(3)), int(match.group(4))
+            else:
+                match = get_pattern('date_month_name').fullmatch(bangla_date)
+                if not match:
+                    raise ValueError(f"Unrecognized date format: {bangla_date}")
+                month = month_numbers.get(match.group(2).lower())
+                if month is None:
+                    raise ValueError(f"Unknown month name: {match.group(2)}")
+                day, year = int(match.group(1)), int(match.group(3))
+
+        if month > 12 and day <= 12:
+            day, month = month, day
+        date(year, month, day)
+
+        day = str(day).translate(english_to_bangla_digits)
+        month = bangla_month_names[month - 1]
+        year = str(year).translate(english_to_bangla_digits)
         return day, month, year
-    except Exception as e:
-        return f"Error: {str(e)}"
+    except (TypeError, ValueError) as e:
+        record_error('extract_date_components_bangla', bangla_date, e)
+        return None
 
 
 def bangla_to_english_number(input_number_str):
     """
     Convert a numeric string containing Bengali or English digits (accepts
     commas, decimal points, and minus signs) into a Python int or float.
-    Returns None if conversion is not possible.
+    Returns None, and records the failure, if conversion is not possible.
     """
     if not isinstance(input_number_str, str):
         input_number_str = str(input_number_str)
@@ -70,8 +96,8 @@ def bangla_to_english_number(input_number_str):
             return float(english_str)
         else:
             return int(english_str)
-    except ValueError:
-        print(f"Warning: Could not convert '{input_number_str}' to English number.")
+    except ValueError as e:
+        record_error('bangla_to_english_number', input_number_str, e)
         return None
 
 
@@ -81,7 +107,7 @@ def remove_extra_spaces(input_text):
     and trim leading/trailing spaces.
     """
 
-    text = re.sub(r'\s+', ' ', input_text).strip()
+    text = ' '.join(input_text.split())
     if "টা টা" in text:
         text = text.replace("টা টা", "টা")
     return text
@@ -97,54 +123,78 @@ def convert_decimal_to_words(decimal_part):
     return decimal_words
 
 
-def get_bangla_time_period(time_str):
+def parse_time(time_str):
     """
-    Given a time string (Bangla or English digits, optional AM/PM), return
-    the Bangla period of the day:
+    Parse a time string (Bangla or English digits, optional seconds,
+    AM/PM marker and টায়/মিনিটে suffix) into (hour, minute, second, meridiem).
+    `hour` is as written, `meridiem` is 'AM', 'PM' or None. Minutes may
+    only be left out when a meridiem is given (e.g. "৭ PM").
+    Returns None if the string is not a valid time.
+    """
+    match = get_pattern('time_components').fullmatch(time_str)
+    if not match:
+        return None
+
+    hour_str, minute_str, second_str, am, pm = match.groups()
+    meridiem = 'AM' if am else 'PM' if pm else None
+    if minute_str is None and meridiem is None:
+        return None
+
+    hour = int(hour_str)
+    minute = int(minute_str) if minute_str else 0
+    second = int(second_str) if second_str else 0
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+    elif hour > 23:
+        return None
+    if minute > 59 or second > 59:
+        return None
+    return hour, minute, second, meridiem
+
+
+def time_period_for_hour(hour):
+    """
+    Return the Bangla period of the day for an hour in 24-hour format:
 
         ভোর (3–6)  |  সকাল (6–12) | দুপুর (12–15)
         বিকেল (15–18) | সন্ধ্যা (18–20) | রাত (20–3)
+    """
+    if 3 <= hour < 6:
+        return "ভোর"
+    elif 6 <= hour < 12:
+        return "সকাল"
+    elif 12 <= hour < 15:
+        return "দুপুর"
+    elif 15 <= hour < 18:
+        return "বিকেল"
+    elif 18 <= hour < 20:
+        return "সন্ধ্যা"
+    else:
+        return "রাত"
 
-    If parsing fails, returns 'ভুল সময় বিন্যাস'.
+
+def to_24_hour(hour, meridiem):
+    """
+    Convert an hour returned by `parse_time` to 24-hour format.
     """
-    bangla_to_english = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
-    cleaned = time_str.translate(bangla_to_english).strip()
-    cleaned = re.sub(r'\s*টায়\s*', '', cleaned)
-    cleaned = cleaned.replace("এ.এম.", "AM").replace("পিএম", "PM").replace("a.m.", "AM").replace("p.m.", "PM")
+    if meridiem is None:
+        return hour
+    return hour % 12 + (12 if meridiem == 'PM' else 0)
 
-    is_12h = "AM" in cleaned or "PM" in cleaned
 
-    try:
-        time_obj = None
-        possible_formats = ["%I:%M:%S %p", "%I:%M %p", "%H:%M:%S", "%H:%M"]
-
-        for fmt in possible_formats:
-            try:
-                time_obj = datetime.strptime(cleaned, fmt)
-                break
-            except ValueError:
-                continue
-
-        if time_obj is None:
-            return "ভুল সময় বিন্যাস"
-
-        hour = time_obj.hour
-
-        if 3 <= hour < 6:
-            return "ভোর"
-        elif 6 <= hour < 12:
-            return "সকাল"
-        elif 12 <= hour < 15:
-            return "দুপুর"
-        elif 15 <= hour < 18:
-            return "বিকেল"
-        elif 18 <= hour < 20:
-            return "সন্ধ্যা"
-        else:
-            return "রাত"
+def get_bangla_time_period(time_str):
+    """
+    Given a time string (Bangla or English digits, optional AM/PM), return
+    the Bangla period of the day (see `time_period_for_hour`).
 
-    except Exception:
+    If parsing fails, returns 'ভুল সময় বিন্যাস'.
+    """
+    parsed = parse_time(time_str)
+    if parsed is None:
         return "ভুল সময় বিন্যাস"
+    hour, _, _, meridiem = parsed
+    return time_period_for_hour(to_24_hour(hour, meridiem))
 
 
 def remove_punctuation(text: str) -> str:
@@ -152,10 +202,7 @@ def remove_punctuation(text: str) -> str:
     Remove common Bengali and English punctuation marks from `text` and
     collapse any resulting multiple spaces into one.
     """
-    bengali_punctuation = "।‘’“”"
-    punctuation_to_remove = string.punctuation + bengali_punctuation + "-"
-    translation_table = str.maketrans('', '', punctuation_to_remove)
-    cleaned_text = text.translate(translation_table)
+    cleaned_text = text.translate(get_table('punctuation_table'))
     cleaned_text = ' '.join(cleaned_text.split())
     return cleaned_text
 
@@ -167,6 +214,8 @@ def translate_english_word(sentence):
     equivalents using the `english_to_bengali_phonetic_map` mapping.
     """
     words = sentence.split()
+    if not get_pattern('latin_letter').search(sentence):
+        return " ".join(words)
     translated_words = [
         english_to_bengali_phonetic_map.get(word.lower(), word)
         for word in words